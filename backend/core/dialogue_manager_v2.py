@@ -394,6 +394,7 @@ class DialogueManagerV2:
             
             # Build minimal state for error case
             canonical_snapshot = state_manager.snapshot_state()
+            state_manager.end_turn()
             canonical_snapshot['consultation_id'] = consultation_id
             canonical_snapshot['turn_count'] = turn_count
             canonical_snapshot['current_episode_id'] = current_episode_id
@@ -418,6 +419,7 @@ class DialogueManagerV2:
         
         # Build canonical snapshot
         canonical_snapshot = state_manager.snapshot_state()
+        state_manager.end_turn()
         canonical_snapshot['consultation_id'] = consultation_id
         canonical_snapshot['turn_count'] = turn_count + 1  # First question is turn 1
         canonical_snapshot['current_episode_id'] = current_episode_id
@@ -537,6 +539,7 @@ class DialogueManagerV2:
             state_snapshot,
             data_model_path="data/clinical_data_model.json"
         )
+        state_manager.begin_turn()  # Ended by the snapshot in _build_turn_result
         
         # Extract turn-level state (not stored in StateManager)
         turn_count = state_snapshot.get('turn_count', 0)
@@ -637,6 +640,7 @@ class DialogueManagerV2:
         
         # Create StateManager and first episode
         state_manager = self.state_manager_class("data/clinical_data_model.json")
+        state_manager.begin_turn()  # Ended by the snapshot that closes this turn
         first_episode_id = state_manager.create_episode()
         
         # V3: Set initial mode explicitly (policy decision, not inference)
@@ -680,6 +684,7 @@ class DialogueManagerV2:
         """
         # Get canonical snapshot (lossless, for persistence)
         canonical_snapshot = state_manager.snapshot_state()
+        state_manager.end_turn()
         
         # V3: Extract current mode from state manager
         current_mode = canonical_snapshot.get('conversation_mode', ConversationMode.MODE_EPISODE_EXTRACTION.value)
@@ -1195,8 +1200,8 @@ class DialogueManagerV2:
             episode_data = state_manager.get_episode_for_selector(episode_id)
             triggered_blocks = self.selector.check_triggers(episode_data)
             
-            # get_episode_for_selector returns lists, convert to set for set operations
-            already_activated = set(episode_data.get('follow_up_blocks_activated', []))
+            # get_episode_for_selector returns frozensets
+            already_activated = episode_data.get('follow_up_blocks_activated', frozenset())
             
             new_blocks = triggered_blocks - already_activated
             for block_id in new_blocks:
@@ -1211,9 +1216,9 @@ class DialogueManagerV2:
         try:
             episode_data = state_manager.get_episode_for_selector(episode_id)
             
-            # get_episode_for_selector returns lists, convert to sets for set operations
-            activated = set(episode_data.get('follow_up_blocks_activated', []))
-            completed = set(episode_data.get('follow_up_blocks_completed', []))
+            # get_episode_for_selector returns frozensets
+            activated = episode_data.get('follow_up_blocks_activated', frozenset())
+            completed = episode_data.get('follow_up_blocks_completed', frozenset())
             pending = activated - completed
             
             for block_id in pending:
@@ -30,11 +30,22 @@ Error Handling:
 
 import json
 import logging
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
+
+# Optional fast path: orjson parses LLM output in C. Falls back to stdlib json.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except covers both.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-from backend.utils.hf_client_v2 import HuggingFaceClient
 from backend.utils.episode_hypothesis_signal import EpisodeHypothesisSignal, ConfidenceBand
 
+# Annotation only: the HF client module imports torch, which EHG itself never needs
+if TYPE_CHECKING:
+    from backend.utils.hf_client_v2 import HuggingFaceClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,7 +73,7 @@ class EpisodeHypothesisGenerator:
     
     def __init__(
         self,
-        hf_client: HuggingFaceClient,
+        hf_client: 'HuggingFaceClient',
         temperature: float = 0.0,
         max_tokens: int = 128
     ) -> None:
@@ -158,16 +169,20 @@ class EpisodeHypothesisGenerator:
             logger.error(f"EHG LLM call failed: {type(e).__name__} - {e}")
             raise RuntimeError(f"EHG LLM call failed: {e}") from e
         
-        logger.debug(f"EHG raw LLM output: {llm_output}")
+        # Guarded: the f-string would otherwise be built on every turn
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"EHG raw LLM output: {llm_output}")
         
         # Parse and validate LLM output
         signal = self._parse_llm_output(llm_output)
         
         logger.info(
-            f"EHG signal: hypothesis_count={signal.hypothesis_count}, "
-            f"confidence={signal.confidence_band.value}, "
-            f"pivot_detected={signal.pivot_detected}, "
-            f"pivot_confidence={signal.pivot_confidence_band.value}"
+            "EHG signal: hypothesis_count=%s, confidence=%s, "
+            "pivot_detected=%s, pivot_confidence=%s",
+            signal.hypothesis_count,
+            signal.confidence_band.value,
+            signal.pivot_detected,
+            signal.pivot_confidence_band.value
         )
         
         return signal
@@ -267,12 +282,27 @@ Respond with ONLY a JSON object in this exact format:
         """
         # Try to parse JSON
         try:
-            parsed = json.loads(llm_output)
+            parsed = _json_loads(llm_output)
         except json.JSONDecodeError as e:
             logger.warning(f"EHG: Invalid JSON from LLM: {e}")
             logger.warning(f"EHG: Raw output was: {llm_output[:200]}")
             return self._safe_default_signal()
         
+        return self._signal_from_parsed(parsed)
+    
+    def _signal_from_parsed(self, parsed: Dict[str, Any]) -> EpisodeHypothesisSignal:
+        """
+        Build signal from already-decoded LLM output.
+        
+        Separated from JSON decoding so the coercion rules (clamping,
+        defaults, confidence mapping) can be exercised on their own.
+        
+        Args:
+            parsed: Decoded JSON dict
+            
+        Returns:
+            EpisodeHypothesisSignal with validated/coerced fields
+        """
         # Validate and extract fields with coercion
         hypothesis_count = self._extract_hypothesis_count(parsed)
         hypothesis_confidence = self._extract_confidence(
@@ -28,6 +28,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any
 
+# Optional fast path: orjson serializes straight to UTF-8 bytes. Falls back to stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -265,12 +271,26 @@ class JSONFormatterV2:
         """
         output_file = Path(file_path)
         
-        # Create parent directory if needed
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        # Serialize up front, then write pretty-printed JSON in one call
+        # (json.dump issues a write() per encoder chunk). Buffered writes are
+        # deliberate: O_DIRECT needs block-aligned buffers and bypasses the page
+        # cache, which costs more than it saves for KB-sized consultation files.
+        if orjson is not None:
+            # Bytes out: no intermediate str or re-encode on write
+            payload = orjson.dumps(data_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            mode = 'wb'
+        else:
+            payload = json.dumps(data_dict, indent=2, ensure_ascii=False)
+            mode = 'w'
         
-        # Write pretty-printed JSON
-        with open(output_file, 'w') as f:
-            json.dump(data_dict, f, indent=2, ensure_ascii=False)
+        try:
+            f = open(output_file, mode)
+        except FileNotFoundError:
+            # Create parent directory only when missing (usually already exists)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            f = open(output_file, mode)
+        with f:
+            f.write(payload)
         
         abs_path = str(output_file.absolute())
         logger.info(f"JSON saved to {abs_path}")
@@ -52,9 +52,11 @@ Provenance hooks:
 """
 
 import copy
+import functools
 import json
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, Any, List
 
 # Flat import for server testing
@@ -67,6 +69,19 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_ruleset(ruleset_path: str, mtime_ns: int) -> dict:
+    """
+    Load and parse a ruleset once per (path, modification time).
+    
+    The returned dict is shared by every selector built from the same file
+    and must be treated as read-only. mtime_ns is part of the key so an
+    edited or rewritten file is re-read.
+    """
+    with open(ruleset_path, 'r') as f:
+        return json.load(f)
+
+
 class QuestionSelectorV2:
     """
     Stateless question selector for multi-episode consultations.
@@ -114,12 +129,10 @@ class QuestionSelectorV2:
         if not self.ruleset_path.exists():
             raise FileNotFoundError(f"Ruleset not found: {ruleset_path}")
         
-        # Load ruleset
-        with open(self.ruleset_path, 'r') as f:
-            raw_ruleset = json.load(f)
-        
-        # Deep copy to ensure we own the data
-        self.ruleset = copy.deepcopy(raw_ruleset)
+        # Load ruleset (parsed once per file version, shared read-only)
+        self.ruleset = _load_ruleset(
+            str(self.ruleset_path), self.ruleset_path.stat().st_mtime_ns
+        )
         
         # Extract top-level components (these are references into frozen ruleset)
         self.section_order = self.ruleset.get("section_order")
@@ -170,10 +183,10 @@ class QuestionSelectorV2:
         # Validate types of tracking sets
         for key in self.REQUIRED_EPISODE_KEYS:
             value = episode_data[key]
-            # Accept both set and list (State Manager may serialize sets as lists)
-            if not isinstance(value, (set, list)):
+            # Accept set, frozenset (State Manager read views) and list (serialized)
+            if not isinstance(value, (set, frozenset, list)):
                 raise AssertionError(
-                    f"episode_data['{key}'] must be set or list, "
+                    f"episode_data['{key}'] must be set, frozenset or list, "
                     f"got {type(value).__name__}"
                 )
     
@@ -182,6 +195,7 @@ class QuestionSelectorV2:
         Create defensive copy of episode_data with sets normalized.
         
         Converts lists to sets for tracking fields, deep copies extracted fields.
+        Read-only mappings (MappingProxyType) are shared without copying.
         
         Args:
             episode_data: Original episode data
@@ -195,6 +209,9 @@ class QuestionSelectorV2:
             if key in self.REQUIRED_EPISODE_KEYS:
                 # Convert to set (handles both set and list input)
                 copied[key] = set(value)
+            elif isinstance(value, MappingProxyType):
+                # Already read-only (e.g. _provenance), no copy needed
+                copied[key] = value
             else:
                 # Deep copy extracted fields
                 copied[key] = copy.deepcopy(value)
@@ -36,20 +36,34 @@ CRITICAL: Episode ID vs Array Index
 - NEVER assume episode_id == list index
 """
 
+import functools
 import logging
-from typing import List, Dict, Any, Optional
+import sys
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 import json
 from pathlib import Path
 from datetime import datetime, timezone
 from enum import Enum
 from dataclasses import dataclass, field
 
+# Optional fast path: orjson parses the data model in C. Falls back to stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from backend.utils.conversation_modes import ConversationMode, VALID_MODES
 from backend.contracts import ValueEnvelope
 
 
 logger = logging.getLogger(__name__)
 
+# Question IDs, template IDs and field names come from a closed vocabulary
+# (ruleset / data model), so interning is bounded and makes repeated set
+# inserts and dict lookups hit the identity fast path.
+_intern = sys.intern
+
 
 # ========================
 # Provenance Constants (V3)
@@ -65,8 +79,8 @@ SOURCE_REPLAY = 'clarification_replay'
 SOURCE_SYSTEM = 'system'
 SOURCE_DEFAULT = 'default'
 
-# Valid source values
-VALID_SOURCES = {
+# Valid source values (immutable whitelist, checked on every provenance write)
+VALID_SOURCES = frozenset({
     SOURCE_RESPONSE_PARSER,
     SOURCE_CLARIFICATION_PARSER,
     SOURCE_FORCED_RESOLUTION,
@@ -75,7 +89,7 @@ VALID_SOURCES = {
     SOURCE_REPLAY,
     SOURCE_SYSTEM,
     SOURCE_DEFAULT
-}
+})
 
 
 class ProvenanceConfidence(str, Enum):
@@ -95,7 +109,10 @@ class ProvenanceConfidence(str, Enum):
 
 
 # Valid confidence values
-VALID_CONFIDENCES = {pc.value for pc in ProvenanceConfidence}
+VALID_CONFIDENCES = frozenset(pc.value for pc in ProvenanceConfidence)
+
+# Keys every provenance record must carry
+_REQUIRED_PROVENANCE_KEYS = frozenset({'source', 'confidence', 'mode'})
 
 # Confidence ordering for weakest-link logic (V3)
 # Used to degrade confidence on collection updates
@@ -105,6 +122,9 @@ CONFIDENCE_ORDER = {
     'high': 2
 }
 
+# Inverse of CONFIDENCE_ORDER (rank -> band), for branchless weakest-link
+_RANK_TO_CONFIDENCE = tuple(sorted(CONFIDENCE_ORDER, key=CONFIDENCE_ORDER.get))
+
 # Provenance record schema (V3)
 # CRITICAL: 'mode' stores ConversationMode enum value directly, not string.
 # This matches conversation_mode field and prevents type drift.
@@ -121,13 +141,83 @@ CONFIDENCE_ORDER = {
 # - No history: Previous provenance is discarded
 # - Write-once per call: Cannot write provenance without value
 # - Weakest-link: Collection updates degrade confidence (never improve)
-ProvenanceRecord = Dict[str, Any]  # Mixed types: str for source/confidence, enum for mode
+ProvenanceRecord = Mapping[str, Any]  # Mixed types: str for source/confidence, enum for mode
 
 # V3: Collection fields for weakest-link confidence logic
 # MUST match collection_schemas in clinical_data_model.json
 # TODO: Auto-detect from data model in future version
 COLLECTION_FIELDS = {'medications', 'allergies', 'past_medical_history', 'family_history'}
 
+# ConversationMode <-> string tables for (de)serialization hot paths.
+# Avoids Enum descriptor/value-lookup machinery per provenance record.
+# Both tables accept members and raw strings: Enum members hash by name, so
+# a member would otherwise miss the string keys (and DialogueManager still
+# assigns conversation_mode as a raw string).
+_MODE_TO_STR: Dict[Any, str] = {
+    **{mode: mode.value for mode in ConversationMode},
+    **{mode.value: mode.value for mode in ConversationMode},
+}
+_STR_TO_MODE: Dict[Any, ConversationMode] = {
+    **{mode.value: mode for mode in ConversationMode},
+    **{mode: mode for mode in ConversationMode},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _deserialize_provenance_record(source: str, confidence: str, mode: Any) -> Optional[ProvenanceRecord]:
+    """
+    Build (or reuse) a deserialized provenance record.
+    
+    The (source, confidence, mode) space is tiny, so identical records are
+    shared across fields and episodes. Records are returned as read-only
+    MappingProxyType views, so a shared record cannot be mutated in place.
+    
+    Returns:
+        MappingProxyType: Provenance record with ConversationMode enum, or None if mode invalid
+    """
+    mode_enum = _STR_TO_MODE.get(mode)
+    if mode_enum is None:
+        return None
+    return MappingProxyType({'source': source, 'confidence': confidence, 'mode': mode_enum})
+
+
+@functools.lru_cache(maxsize=None)
+def _load_data_model(data_model_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Load and parse the clinical data model once per (path, modification time).
+    
+    StateManagerV2 is rehydrated every turn, so without this each turn
+    re-reads and re-parses the same file. The returned dict is shared
+    across instances and must be treated as read-only (shared_data is
+    deep-copied from its template). Callers pass the resolved path, so a
+    relative path is not confused across working directories, and
+    mtime_ns is part of the key so an edited file is re-read.
+    """
+    data_model_file = Path(data_model_path)
+    if orjson is not None:
+        return orjson.loads(data_model_file.read_bytes())
+    with open(data_model_file, 'r') as f:
+        return json.load(f)
+
+
+# Prebuilt default provenance records, one per mode (keyed by member and string).
+# Shared across all default writes and consultations, so they are read-only
+# MappingProxyType views and no per-write dict allocation is needed.
+_DEFAULT_PROVENANCE_BY_MODE: Dict[Any, ProvenanceRecord] = {
+    mode: MappingProxyType({
+        'source': SOURCE_DEFAULT,
+        'confidence': ProvenanceConfidence.LOW.value,
+        'mode': mode
+    })
+    for mode in ConversationMode
+}
+_DEFAULT_PROVENANCE_BY_MODE.update(
+    {mode.value: record for mode, record in list(_DEFAULT_PROVENANCE_BY_MODE.items())}
+)
+
+# Provenance owner key for shared_data (episode IDs are 1-indexed, so 0 is free)
+SHARED_PROVENANCE_OWNER = 0
+
 
 # ========================
 # Clarification Models
@@ -152,7 +242,7 @@ class ClarificationResolution(str, Enum):
     UNRESOLVABLE = "unresolvable"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClarificationTurn:
     """
     Single turn in clarification transcript.
@@ -161,6 +251,8 @@ class ClarificationTurn:
     The replayable flag is denormalized from template registry to ensure
     replay semantics remain stable across template changes.
     
+    Uses __slots__ (no per-instance __dict__) since transcripts hold many turns.
+    
     Fields:
         template_id: ID of clarification question template
         user_text: Raw user response (verbatim)
@@ -182,7 +274,7 @@ class ClarificationTurn:
         # Replay adapter validates rendered_text presence when needed
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dict for serialization"""
+        """Convert to dict for serialization (literal, avoids dataclasses.asdict)"""
         return {
             'template_id': self.template_id,
             'user_text': self.user_text,
@@ -291,12 +383,16 @@ class StateManagerV2:
     # - get_episode_for_selector(): INCLUDES operational, INCLUDES full provenance
     # - get_episode(): INCLUDES operational, INCLUDES full provenance
     # - snapshot_state(): INCLUDES operational, INCLUDES full provenance
-    OPERATIONAL_FIELDS = {
+    OPERATIONAL_FIELDS = frozenset({
         'questions_answered',
         'questions_satisfied',
         'follow_up_blocks_activated',
         'follow_up_blocks_completed'
-    }
+    })
+    
+    # Episode metadata present on every episode; restoring any other
+    # non-operational field from a snapshot marks the episode non-empty.
+    METADATA_FIELDS = frozenset({'episode_id', 'timestamp_started', 'timestamp_last_updated'})
     
     def __init__(self, data_model_path: str = "data/clinical_data_model.json"):
         """
@@ -305,20 +401,46 @@ class StateManagerV2:
         Args:
             data_model_path: Path to clinical data model JSON file
         """
-        # Load clinical data model
-        data_model_file = Path(data_model_path)
+        # Load clinical data model (parsed once per file version, shared read-only)
+        data_model_file = Path(data_model_path).resolve()
         if not data_model_file.exists():
             raise FileNotFoundError(f"Clinical data model not found: {data_model_path}")
-            
-        with open(data_model_file, 'r') as f:
-            self.data_model = json.load(f)
+        self.data_model = _load_data_model(
+            str(data_model_file), data_model_file.stat().st_mtime_ns
+        )
             
         # Initialize state from template
         self.episodes: List[Dict[str, Any]] = []
         self.shared_data: Dict[str, Any] = self._deep_copy(self.data_model["shared_data_template"])
-        self.shared_data['_provenance'] = {}  # V3: Field-level provenance tracking
         self.dialogue_history: Dict[int, List[Dict[str, Any]]] = {}
         
+        # V3: Field-level provenance indexed by owner, then field_name, where owner
+        # is episode_id or SHARED_PROVENANCE_OWNER. Kept outside the episode dicts;
+        # exports attach each owner's records as '_provenance', so the external
+        # representation is unchanged.
+        self._provenance: Dict[int, Dict[str, ProvenanceRecord]] = {}
+        
+        # Cached frozenset views of tracking sets, keyed by (episode_id, field).
+        # Invalidated by the mark_*/activate/complete writers; read paths hand
+        # these out directly instead of copying the mutable set each call.
+        self._frozen_tracking_sets: Dict[Tuple[int, str], frozenset] = {}
+        
+        # Serialized provenance records keyed by (owner, field_name), where owner
+        # is episode_id or SHARED_PROVENANCE_OWNER. Invalidated in _store_provenance
+        # so snapshot cost tracks changed fields, not total fields.
+        self._serialized_provenance: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        
+        # IDs of episodes holding at least one clinical field. Maintained by
+        # set_episode_field()/from_snapshot() so export_clinical_view() can skip
+        # empty episodes without scanning their fields.
+        self._non_empty_episode_ids: set = set()
+        
+        # ISO 8601 UTC timestamp shared by all writes within one turn.
+        # Only cached between begin_turn() and end_turn(); outside an explicit
+        # turn every write takes the current time.
+        self._in_turn = False
+        self._turn_timestamp: Optional[str] = None
+        
         # Clarification context (only exists during MODE_CLARIFICATION)
         self.clarification_context: Optional[ClarificationContext] = None
         
@@ -378,12 +500,8 @@ class StateManagerV2:
             self._validate_conversation_mode("invalid")  # ValueError
             self._validate_conversation_mode(None)  # ValueError
         """
-        # Accept enum directly (V3)
-        if isinstance(mode, ConversationMode):
-            return
-        
-        # Accept string for backwards compat
-        if mode not in VALID_MODES:
+        # Accept enum directly (V3), or string for backwards compat
+        if not isinstance(mode, str) or _STR_TO_MODE.get(mode) is None:
             raise ValueError(
                 f"Invalid conversation_mode: '{mode}'. "
                 f"Must be one of {VALID_MODES} or ConversationMode enum"
@@ -408,6 +526,101 @@ class StateManagerV2:
         else:
             return obj
     
+    def _copy_dialogue_history(self) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Copy dialogue history in a single pass.
+        
+        Turns are flat except for 'extracted' (see add_dialogue_turn), so only
+        that value needs a deep copy; everything else is immutable.
+        
+        Returns:
+            dict: {episode_id: [turns]} (safe to modify)
+        """
+        return {
+            episode_id: [
+                {**turn, 'extracted': self._deep_copy(turn['extracted'])}
+                for turn in turns
+            ]
+            for episode_id, turns in self.dialogue_history.items()
+        }
+    
+    def _frozen_tracking_set(self, episode: Dict[str, Any], key: str) -> frozenset:
+        """
+        Get cached immutable view of an episode tracking set.
+        
+        Args:
+            episode: Internal episode dict
+            key: One of OPERATIONAL_FIELDS
+            
+        Returns:
+            frozenset: Snapshot of the tracking set, rebuilt only after a write
+        """
+        cache_key = (episode['episode_id'], key)
+        frozen = self._frozen_tracking_sets.get(cache_key)
+        if frozen is None:
+            frozen = frozenset(episode[key])
+            self._frozen_tracking_sets[cache_key] = frozen
+        return frozen
+    
+    def _invalidate_tracking_set(self, episode_id: int, key: str) -> None:
+        """Drop cached frozenset view after a tracking set write"""
+        self._frozen_tracking_sets.pop((episode_id, key), None)
+    
+    def _now_iso(self) -> str:
+        """
+        Get the ISO 8601 UTC timestamp for a write.
+        
+        Inside begin_turn()/end_turn() the timestamp is computed on first
+        use and reused for every write in the turn. Outside a turn each
+        call returns the current time.
+        
+        Returns:
+            str: ISO 8601 UTC timestamp
+        """
+        if not self._in_turn:
+            return datetime.now(timezone.utc).isoformat()
+        if self._turn_timestamp is None:
+            self._turn_timestamp = datetime.now(timezone.utc).isoformat()
+        return self._turn_timestamp
+    
+    def _provenance_for(self, owner: int) -> Dict[str, ProvenanceRecord]:
+        """
+        Get provenance records for one owner from the per-owner index.
+        
+        Args:
+            owner: episode_id or SHARED_PROVENANCE_OWNER
+            
+        Returns:
+            dict: Live {field_name: record} in write order (read-only, do not mutate)
+        """
+        return self._provenance.get(owner, {})
+    
+    def _load_provenance(self, owner: int, provenance: Dict[str, ProvenanceRecord]) -> None:
+        """
+        Bulk-insert deserialized provenance for one owner (rehydration only).
+        
+        Args:
+            owner: episode_id or SHARED_PROVENANCE_OWNER
+            provenance: {field_name: record} with enum modes
+        """
+        self._provenance.setdefault(owner, {}).update(provenance)
+    
+    def _copy_provenance(self, provenance: Dict[str, ProvenanceRecord]) -> Dict[str, Dict[str, Any]]:
+        """
+        Copy one owner's provenance into plain, caller-owned dicts.
+        
+        Stored records may be shared read-only views, so they are copied
+        out rather than handed to callers that are free to modify them.
+        Records are flat, so a shallow copy per record suffices.
+        
+        Args:
+            provenance: {field_name: record} with enum modes
+            
+        Returns:
+            dict: {field_name: dict} (mode stays ConversationMode enum)
+        """
+        return {field_name: dict(record) for field_name, record in provenance.items()}
+    
     # ========================
     # Provenance Helpers (V3)
     # ========================
@@ -430,8 +643,7 @@ class StateManagerV2:
             raise ValueError("Provenance must be dict or None")
         
         # Check required keys
-        required_keys = {'source', 'confidence', 'mode'}
-        missing = required_keys - provenance.keys()
+        missing = _REQUIRED_PROVENANCE_KEYS - provenance.keys()
         if missing:
             raise ValueError(f"Provenance missing required keys: {missing}")
         
@@ -459,16 +671,12 @@ class StateManagerV2:
     
     def _default_provenance(self) -> ProvenanceRecord:
         """
-        Generate default provenance for legacy writes.
+        Get default provenance for legacy writes.
         
         Returns:
-            dict: Default provenance record with enum mode
+            MappingProxyType: Shared prebuilt default record with enum mode (read-only)
         """
-        return {
-            'source': SOURCE_DEFAULT,
-            'confidence': ProvenanceConfidence.LOW.value,
-            'mode': self.conversation_mode  # Already a ConversationMode enum
-        }
+        return _DEFAULT_PROVENANCE_BY_MODE[self.conversation_mode]
     
     def _confidence_float_to_band(self, confidence: float) -> str:
         """
@@ -524,24 +732,27 @@ class StateManagerV2:
             # First write - no degradation
             return new_provenance
         
-        old_conf = existing_provenance['confidence']
         new_conf = new_provenance['confidence']
         
-        # Take lower confidence
-        if CONFIDENCE_ORDER[old_conf] < CONFIDENCE_ORDER[new_conf]:
-            degraded = self._deep_copy(new_provenance)
-            degraded['confidence'] = old_conf
-            logger.debug(
-                f"Degraded confidence from {new_conf} to {old_conf} "
-                f"(weakest-link for collection update)"
-            )
-            return degraded
+        # Take lower confidence (rank table lookup, no comparison chain)
+        weakest = _RANK_TO_CONFIDENCE[
+            min(CONFIDENCE_ORDER[existing_provenance['confidence']], CONFIDENCE_ORDER[new_conf])
+        ]
+        if weakest == new_conf:
+            return new_provenance
         
-        return new_provenance
+        # Records are flat, so a shallow copy suffices
+        degraded = dict(new_provenance)
+        degraded['confidence'] = weakest
+        logger.debug(
+            f"Degraded confidence from {new_conf} to {weakest} "
+            f"(weakest-link for collection update)"
+        )
+        return degraded
     
     def _store_provenance(
         self,
-        provenance_dict: Dict[str, ProvenanceRecord],
+        owner: int,
         field_name: str,
         provenance: Optional[ProvenanceRecord],
         is_collection: bool = False
@@ -555,23 +766,31 @@ class StateManagerV2:
         - Collection fields apply weakest-link confidence degradation
         
         Args:
-            provenance_dict: Target _provenance dict (episode or shared)
+            owner: episode_id, or SHARED_PROVENANCE_OWNER for shared_data
             field_name: Field being written
             provenance: Provenance record or None (use default)
             is_collection: Whether field is a collection (weakest-link applies)
         """
         if provenance is None:
-            provenance = self._default_provenance()
+            default = provenance = self._default_provenance()
         else:
+            default = None
             self._validate_provenance(provenance)
         
         # Apply weakest-link for collections
+        owner_provenance = self._provenance.setdefault(owner, {})
         if is_collection:
-            existing = provenance_dict.get(field_name)
+            existing = owner_provenance.get(field_name)
             provenance = self._apply_weakest_link_confidence(existing, provenance)
         
         # Store (overwrites existing - last-writer-wins)
-        provenance_dict[field_name] = self._deep_copy(provenance)
+        # Every stored record is read-only: shared defaults are stored as-is,
+        # caller-owned dicts are copied (records are flat) and frozen
+        if provenance is default:
+            owner_provenance[field_name] = provenance
+        else:
+            owner_provenance[field_name] = MappingProxyType(dict(provenance))
+        self._serialized_provenance.pop((owner, field_name), None)
         logger.debug(f"Stored provenance for {field_name}: {provenance}")
     
     # ========================
@@ -593,6 +812,7 @@ class StateManagerV2:
         
         Converts sets to sorted lists for JSON compatibility.
         Optionally excludes operational fields and/or provenance.
+        Provenance is read from the per-owner index and attached as '_provenance'.
         
         Args:
             episode: Episode dict to serialize
@@ -609,46 +829,61 @@ class StateManagerV2:
             if exclude_operational and key in self.OPERATIONAL_FIELDS:
                 continue
             
-            # V3: Skip provenance if requested
-            if exclude_provenance and key == '_provenance':
-                continue
-            
-            # V3: Serialize provenance dict (handle enum mode)
-            if key == '_provenance' and isinstance(value, dict):
-                if serialize_provenance:
-                    result[key] = self._serialize_provenance_dict(value)
-                else:
-                    # Deep copy but keep enum
-                    result[key] = self._deep_copy(value)
-                continue
-            
             # Convert sets to sorted lists, deep copy everything else
             if isinstance(value, set):
-                result[key] = sorted(list(value))
+                result[key] = sorted(value)
             else:
                 result[key] = self._deep_copy(value)
         
+        # V3: Attach provenance unless excluded (handle enum mode)
+        if not exclude_provenance:
+            episode_id = episode['episode_id']
+            provenance = self._provenance_for(episode_id)
+            if serialize_provenance:
+                result['_provenance'] = self._serialize_provenance_dict(provenance, owner=episode_id)
+            else:
+                # Copy but keep enum
+                result['_provenance'] = self._copy_provenance(provenance)
+        
         return result
     
-    def _serialize_provenance_dict(self, provenance_dict: Dict[str, ProvenanceRecord]) -> Dict[str, Dict[str, Any]]:
+    def _serialize_provenance_dict(
+        self,
+        provenance_dict: Dict[str, ProvenanceRecord],
+        owner: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Serialize provenance dict with enum mode conversion.
         
         Converts ConversationMode enum to string for JSON serialization.
         
+        When owner is given, provenance_dict must hold that owner's live records
+        from the per-owner index; records are memoized in _serialized_provenance
+        and reused until _store_provenance overwrites the field. Each call
+        returns fresh copies of the memoized records, so snapshots never share
+        dicts with each other or with the memo.
+        
         Args:
             provenance_dict: Raw _provenance dict
+            owner: episode_id or SHARED_PROVENANCE_OWNER to enable memoization
             
         Returns:
             dict: Serialized provenance with mode as string
         """
+        cache = self._serialized_provenance
         serialized = {}
         for field_name, prov_record in provenance_dict.items():
-            serialized[field_name] = {
-                'source': prov_record['source'],
-                'confidence': prov_record['confidence'],
-                'mode': prov_record['mode']  # Enum -> string for JSON
-            }
+            cache_key = (owner, field_name)
+            record = cache.get(cache_key) if owner is not None else None
+            if record is None:
+                record = {
+                    'source': prov_record['source'],
+                    'confidence': prov_record['confidence'],
+                    'mode': _MODE_TO_STR[prov_record['mode']]  # Enum -> string for JSON
+                }
+                if owner is not None:
+                    cache[cache_key] = record
+            serialized[field_name] = dict(record)
         return serialized
     
     def _deserialize_provenance_dict(self, provenance_dict: Dict[str, Dict[str, Any]]) -> Dict[str, ProvenanceRecord]:
@@ -665,11 +900,18 @@ class StateManagerV2:
         """
         deserialized = {}
         for field_name, prov_record in provenance_dict.items():
-            deserialized[field_name] = {
-                'source': prov_record['source'],
-                'confidence': prov_record['confidence'],
-                'mode': ConversationMode(prov_record['mode'])  # String -> enum
-            }
+            # String -> enum (memoized, records are shared read-only)
+            record = _deserialize_provenance_record(
+                prov_record['source'],
+                prov_record['confidence'],
+                prov_record['mode']
+            )
+            if record is None:
+                raise ValueError(
+                    f"Invalid provenance mode for {field_name}: '{prov_record['mode']}'. "
+                    f"Must be one of {VALID_MODES}"
+                )
+            deserialized[field_name] = record
         return deserialized
     
     def _serialize_shared_data(self, exclude_provenance: bool = False) -> Dict[str, Any]:
@@ -687,11 +929,11 @@ class StateManagerV2:
         """
         serialized = self._deep_copy(self.shared_data)
         
-        if exclude_provenance and '_provenance' in serialized:
-            del serialized['_provenance']
-        elif '_provenance' in serialized:
-            # Serialize provenance dict (handle enum mode)
-            serialized['_provenance'] = self._serialize_provenance_dict(serialized['_provenance'])
+        if not exclude_provenance:
+            serialized['_provenance'] = self._serialize_provenance_dict(
+                self._provenance_for(SHARED_PROVENANCE_OWNER),
+                owner=SHARED_PROVENANCE_OWNER
+            )
         
         return serialized
     
@@ -701,17 +943,18 @@ class StateManagerV2:
         
         V3: Summary gets source + confidence only (no mode).
         
-        CRITICAL: Deep-copies input before mutation to prevent contaminating
-        other consumers in the call stack.
+        CRITICAL: Never mutates input. Only the top-level '_provenance' key
+        is rebound, so a shallow copy is sufficient - nested values are
+        aliased, not rebuilt (callers pass already-serialized copies).
         
         Args:
             data: Episode or shared_data dict with _provenance
             
         Returns:
-            dict: Deep-copied data with filtered _provenance
+            dict: Shallow copy of data with filtered _provenance
         """
-        # CRITICAL: Deep-copy before mutation
-        data = self._deep_copy(data)
+        # CRITICAL: Copy before rebinding '_provenance' (input left untouched)
+        data = dict(data)
         
         if '_provenance' not in data:
             return data
@@ -795,7 +1038,7 @@ class StateManagerV2:
         
         # Create immutable turn (dataclass validates in __post_init__)
         turn = ClarificationTurn(
-            template_id=template_id,
+            template_id=_intern(template_id),
             user_text=user_text,
             replayable=replayable,
             rendered_text=rendered_text
@@ -905,7 +1148,7 @@ class StateManagerV2:
             # episode_id = 1
         """
         episode_id = len(self.episodes) + 1
-        current_time = datetime.now(timezone.utc).isoformat()
+        current_time = self._now_iso()
         
         episode = {
             'episode_id': episode_id,
@@ -915,7 +1158,7 @@ class StateManagerV2:
             'questions_satisfied': set(),
             'follow_up_blocks_activated': set(),
             'follow_up_blocks_completed': set(),
-            '_provenance': {},  # V3: Field-level provenance tracking
+            # V3: Field-level provenance lives in self._provenance
             # All other fields added dynamically via set_episode_field()
         }
         
@@ -989,6 +1232,7 @@ class StateManagerV2:
             )
         """
         self._validate_episode_id(episode_id)
+        field_name = _intern(field_name)
         
         index = episode_id - 1
         episode = self.episodes[index]
@@ -1017,10 +1261,11 @@ class StateManagerV2:
                 f"ValueEnvelope stored directly in episode field '{field_name}'. "
                 "Envelopes must be collapsed to value + provenance, never stored."
             )
-        episode['timestamp_last_updated'] = datetime.now(timezone.utc).isoformat()
+        episode['timestamp_last_updated'] = self._now_iso()
+        self._non_empty_episode_ids.add(episode_id)
         
         # Store provenance (episode fields are not collections)
-        self._store_provenance(episode['_provenance'], field_name, provenance, is_collection=False)
+        self._store_provenance(episode_id, field_name, provenance, is_collection=False)
         
         logger.debug(f"Episode {episode_id}: {field_name} = {actual_value}")
     
@@ -1123,11 +1368,13 @@ class StateManagerV2:
         """
         self._validate_episode_id(episode_id)
         
+        question_id = _intern(question_id)
         episode = self.episodes[episode_id - 1]
         episode['questions_answered'].add(question_id)
+        self._invalidate_tracking_set(episode_id, 'questions_answered')
         logger.debug(f"Episode {episode_id}: marked question '{question_id}' as answered")
     
-    def get_questions_answered(self, episode_id: int) -> set:
+    def get_questions_answered(self, episode_id: int) -> frozenset:
         """
         Get set of answered question IDs for an episode.
         
@@ -1135,7 +1382,7 @@ class StateManagerV2:
             episode_id: Episode to query (1-indexed)
             
         Returns:
-            set[str]: Copy of questions_answered set
+            frozenset[str]: Immutable view of questions_answered (cached until next write)
             
         Raises:
             ValueError: If episode_id doesn't exist
@@ -1143,7 +1390,7 @@ class StateManagerV2:
         self._validate_episode_id(episode_id)
         
         episode = self.episodes[episode_id - 1]
-        return episode['questions_answered'].copy()
+        return self._frozen_tracking_set(episode, 'questions_answered')
     
     def mark_question_satisfied(self, episode_id: int, question_id: str) -> None:
         """
@@ -1167,11 +1414,13 @@ class StateManagerV2:
         """
         self._validate_episode_id(episode_id)
         
+        question_id = _intern(question_id)
         episode = self.episodes[episode_id - 1]
         episode['questions_satisfied'].add(question_id)
+        self._invalidate_tracking_set(episode_id, 'questions_satisfied')
         logger.debug(f"Episode {episode_id}: marked question '{question_id}' as satisfied")
     
-    def get_questions_satisfied(self, episode_id: int) -> set:
+    def get_questions_satisfied(self, episode_id: int) -> frozenset:
         """
         Get set of satisfied question IDs for an episode.
         
@@ -1179,7 +1428,7 @@ class StateManagerV2:
             episode_id: Episode to query (1-indexed)
             
         Returns:
-            set[str]: Copy of questions_satisfied set
+            frozenset[str]: Immutable view of questions_satisfied (cached until next write)
             
         Raises:
             ValueError: If episode_id doesn't exist
@@ -1187,7 +1436,7 @@ class StateManagerV2:
         self._validate_episode_id(episode_id)
         
         episode = self.episodes[episode_id - 1]
-        return episode['questions_satisfied'].copy()
+        return self._frozen_tracking_set(episode, 'questions_satisfied')
     
     # ========================
     # Follow-up Block Tracking (for Question Selector V2)
@@ -1208,6 +1457,7 @@ class StateManagerV2:
         
         episode = self.episodes[episode_id - 1]
         episode['follow_up_blocks_activated'].add(block_id)
+        self._invalidate_tracking_set(episode_id, 'follow_up_blocks_activated')
         logger.info(f"Episode {episode_id}: activated follow-up block '{block_id}'")
     
     def complete_follow_up_block(self, episode_id: int, block_id: str) -> None:
@@ -1225,6 +1475,7 @@ class StateManagerV2:
         
         episode = self.episodes[episode_id - 1]
         episode['follow_up_blocks_completed'].add(block_id)
+        self._invalidate_tracking_set(episode_id, 'follow_up_blocks_completed')
         logger.info(f"Episode {episode_id}: completed follow-up block '{block_id}'")
     
     def get_episode_for_selector(self, episode_id: int) -> Dict[str, Any]:
@@ -1237,18 +1488,30 @@ class StateManagerV2:
         (questions_answered, questions_satisfied, follow_up_blocks_activated, 
         follow_up_blocks_completed).
         
+        Tracking sets are returned as cached frozensets (immutable, no copy).
+        Provenance is returned as a read-only MappingProxyType over a shallow
+        copy of the episode's field map; the records themselves are shared
+        without copying, which is safe because stored records are read-only
+        MappingProxyType views. Later writes do not show up in a returned view.
+        
         Args:
             episode_id: Episode to retrieve (1-indexed)
             
         Returns:
-            dict: Episode data with tracking sets (deep copy, safe to modify)
+            dict: Episode data (clinical fields deep copied) with frozenset tracking
+                sets and read-only '_provenance'
             
         Raises:
             ValueError: If episode_id doesn't exist
         """
         self._validate_episode_id(episode_id)
-        # V3: serialize_provenance=False keeps enum mode (internal representation)
-        return self._serialize_episode(self.episodes[episode_id - 1], exclude_operational=False, serialize_provenance=False)
+        episode = self.episodes[episode_id - 1]
+        result = self._serialize_episode(episode, exclude_operational=True, exclude_provenance=True)
+        # V3: Enum mode kept (internal representation), exposed read-only
+        result['_provenance'] = MappingProxyType(dict(self._provenance_for(episode_id)))
+        for key in self.OPERATIONAL_FIELDS:
+            result[key] = self._frozen_tracking_set(episode, key)
+        return result
     
     # ========================
     # Shared Data Management
@@ -1320,6 +1583,8 @@ class StateManagerV2:
                 ValueEnvelope(value='current', source='response_parser', confidence=0.9)
             )
         """
+        field_name = _intern(field_name)
+        
         # V4: Collapse envelope to value + provenance
         if isinstance(value, ValueEnvelope):
             actual_value = value.value
@@ -1350,9 +1615,9 @@ class StateManagerV2:
         
         # Store provenance with weakest-link for collections
         self._store_provenance(
-            self.shared_data['_provenance'], 
-            field_name, 
-            provenance, 
+            SHARED_PROVENANCE_OWNER,
+            field_name,
+            provenance,
             is_collection=is_collection
         )
         
@@ -1394,9 +1659,11 @@ class StateManagerV2:
         Get all shared data (deep copy).
         
         Returns:
-            dict: Shared data (deep copy, safe to modify)
+            dict: Shared data with _provenance (deep copy, safe to modify)
         """
-        return self._deep_copy(self.shared_data)
+        shared = self._deep_copy(self.shared_data)
+        shared['_provenance'] = self._copy_provenance(self._provenance_for(SHARED_PROVENANCE_OWNER))
+        return shared
     
     def get_shared_field(self, field_name: str, default: Any = None) -> Any:
         """
@@ -1448,14 +1715,14 @@ class StateManagerV2:
         self._validate_episode_id(episode_id)
         
         if timestamp is None:
-            timestamp = datetime.now(timezone.utc).isoformat()
+            timestamp = self._now_iso()
         
         turn_id = len(self.dialogue_history[episode_id]) + 1
         
         turn = {
             'turn_id': turn_id,
             'timestamp': timestamp,
-            'question_id': question_id,
+            'question_id': _intern(question_id),
             'question': question_text,
             'response': patient_response,
             'extracted': self._deep_copy(extracted_fields)
@@ -1487,7 +1754,7 @@ class StateManagerV2:
         Returns:
             dict: {episode_id: [dialogue turns]} (deep copy, safe to modify)
         """
-        return self._deep_copy(self.dialogue_history)
+        return self._copy_dialogue_history()
     
     # ========================
     # Export Methods
@@ -1531,13 +1798,15 @@ class StateManagerV2:
         if self.clarification_context is not None:
             clarification_context_dict = self.clarification_context.to_dict()
         
-        return {
+        snapshot = {
             'episodes': serializable_episodes,
             'shared_data': self._serialize_shared_data(exclude_provenance=False),  # V3: Include provenance
-            'dialogue_history': self._deep_copy(self.dialogue_history),
-            'conversation_mode': self.conversation_mode,  # V3: Serialize enum to string
+            'dialogue_history': self._copy_dialogue_history(),
+            'conversation_mode': _MODE_TO_STR[self.conversation_mode],  # V3: Serialize enum to string
             'clarification_context': clarification_context_dict  # V3: Clarification buffer
         }
+        
+        return snapshot
     
     @classmethod
     def from_snapshot(cls, snapshot: Dict[str, Any], 
@@ -1577,17 +1846,22 @@ class StateManagerV2:
                     continue  # Already set by create_episode
                 
                 # V3: Deserialize provenance dict (convert mode string to enum)
+                # into the per-owner index; empty provenance needs no work
                 if field_name == '_provenance' and isinstance(value, dict):
-                    episode[field_name] = state_manager._deserialize_provenance_dict(value)
+                    if value:
+                        state_manager._load_provenance(
+                            episode_id,
+                            state_manager._deserialize_provenance_dict(value)
+                        )
                     continue
                 
                 # Convert lists back to sets for operational fields
-                if field_name in {'questions_answered', 'questions_satisfied',
-                                 'follow_up_blocks_activated', 
-                                 'follow_up_blocks_completed'}:
+                if field_name in cls.OPERATIONAL_FIELDS:
                     episode[field_name] = set(value) if isinstance(value, list) else value
                 else:
                     episode[field_name] = state_manager._deep_copy(value)
+                    if field_name not in cls.METADATA_FIELDS:
+                        state_manager._non_empty_episode_ids.add(episode_id)
             
             # Backward compatibility: Hydrate questions_satisfied if missing from snapshot
             # Rule: questions_satisfied = questions_answered for old sessions
@@ -1597,13 +1871,19 @@ class StateManagerV2:
                 logger.debug(f"Episode {episode_id}: hydrated questions_satisfied from questions_answered (backward compatibility)")
         
         # Restore shared data (flat structure)
+        # Provenance is rebuilt by deserialization, so it is not deep-copied first
         shared_data = snapshot.get('shared_data', {})
-        state_manager.shared_data = state_manager._deep_copy(shared_data)
+        state_manager.shared_data = {
+            key: state_manager._deep_copy(value)
+            for key, value in shared_data.items()
+            if key != '_provenance'
+        }
         
         # V3: Deserialize provenance if present
-        if '_provenance' in state_manager.shared_data:
-            state_manager.shared_data['_provenance'] = state_manager._deserialize_provenance_dict(
-                state_manager.shared_data['_provenance']
+        if shared_data.get('_provenance'):
+            state_manager._load_provenance(
+                SHARED_PROVENANCE_OWNER,
+                state_manager._deserialize_provenance_dict(shared_data['_provenance'])
             )
         
         # Restore dialogue history
@@ -1621,10 +1901,7 @@ class StateManagerV2:
         state_manager._validate_conversation_mode(mode)
         
         # V3: Store as enum if string provided (migration path)
-        if isinstance(mode, str):
-            state_manager.conversation_mode = ConversationMode(mode)
-        else:
-            state_manager.conversation_mode = mode
+        state_manager.conversation_mode = _STR_TO_MODE[mode]
         
         # Restore clarification context if present (V3)
         clarification_data = snapshot.get('clarification_context')
@@ -1658,16 +1935,11 @@ class StateManagerV2:
         """
         # POLICY: Filter to clinical data only (State Manager's authority)
         # V3: Strip operational AND provenance for clinical output
-        serializable_episodes = [
+        # Empty episodes (metadata only) are skipped via the maintained flag set
+        non_empty_episodes = [
             self._serialize_episode(ep, exclude_operational=True, exclude_provenance=True)
             for ep in self.episodes
-        ]
-        
-        # Filter empty episodes (only have metadata, no clinical fields)
-        metadata_fields = {'episode_id', 'timestamp_started', 'timestamp_last_updated'}
-        non_empty_episodes = [
-            ep for ep in serializable_episodes
-            if set(ep.keys()) - metadata_fields  # Has at least one clinical field
+            if ep['episode_id'] in self._non_empty_episode_ids
         ]
         
         # MECHANISM: Ensure no envelopes leak to output (defense in depth)
@@ -1721,13 +1993,30 @@ class StateManagerV2:
             'shared_data': self._filter_provenance_for_summary(
                 self._serialize_shared_data(exclude_provenance=False)
             ),
-            'dialogue_history': self._deep_copy(self.dialogue_history)
+            'dialogue_history': self._copy_dialogue_history()
         }
     
     # ========================
     # Utility Methods
     # ========================
     
+    def begin_turn(self) -> None:
+        """
+        Start a turn: writes until end_turn() share one timestamp.
+        
+        Called by DialogueManager around command processing. Writes made
+        outside a turn are stamped with the current time individually.
+        """
+        self._in_turn = True
+        self._turn_timestamp = None
+    
+    def end_turn(self) -> None:
+        """
+        End the current turn: later writes take fresh timestamps.
+        """
+        self._in_turn = False
+        self._turn_timestamp = None
+    
     def reset(self) -> None:
         """
         Clear all state (for starting new consultation).
@@ -1737,6 +2026,11 @@ class StateManagerV2:
         self.episodes.clear()
         self.shared_data = self._deep_copy(self.data_model["shared_data_template"])
         self.dialogue_history.clear()
+        self._frozen_tracking_sets.clear()
+        self._non_empty_episode_ids.clear()
+        self._provenance.clear()
+        self._serialized_provenance.clear()
+        self.end_turn()
         logger.info("State Manager reset - all data cleared")
     
     def get_summary_stats(self) -> Dict[str, Any]:
@@ -15,11 +15,16 @@ Design principles:
 """
 
 import logging
+import re
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from backend.utils.hf_client_v2 import HuggingFaceClient
 
 logger = logging.getLogger(__name__)
 
+# Runs of 3+ newlines (collapsed to one blank line in cleaned summaries)
+_EXCESS_BLANK_LINES = re.compile(r'\n{3,}')
+
 
 class SummaryGeneratorV2:
     """Generate clinical summaries from multi-episode consultations"""
@@ -39,6 +44,9 @@ class SummaryGeneratorV2:
         ]
     }
     
+    # Exact-match cache of greedy (temperature 0) episode summaries (LRU, per instance)
+    EPISODE_CACHE_SIZE = 32
+    
     def __init__(self, hf_client):
         """
         Initialize Summary Generator V2
@@ -57,6 +65,11 @@ class SummaryGeneratorV2:
         
         self.hf_client = hf_client
         
+        # prompt -> cleaned episode summary, temperature 0 only (sampled output
+        # must be regenerated). Exact match only: a near-match could return
+        # another consultation's narrative.
+        self._episode_cache: "OrderedDict[str, str]" = OrderedDict()
+        
         logger.info("Summary Generator V2 initialized")
     
     # ==================== PUBLIC API ====================
@@ -169,9 +182,14 @@ class SummaryGeneratorV2:
         from pathlib import Path
         
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
+        try:
+            f = open(output_file, 'w')
+        except FileNotFoundError:
+            # Create parent directory only when missing (usually already exists)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            f = open(output_file, 'w')
+        with f:
             f.write(summary_text)
         
         logger.info(f"Summary saved to {output_file}")
@@ -217,6 +235,11 @@ class SummaryGeneratorV2:
         """
         Generate summary for single episode using LLM
         
+        Greedy results (temperature 0) are cached on the exact prompt, so
+        regenerating outputs for an unchanged consultation skips the LLM.
+        Sampled results (temperature > 0) are never cached: a repeat request
+        gets a fresh sample.
+        
         Args:
             episode_data: Episode dict from episodes array
             dialogue_turns: Dialogue history for this episode
@@ -235,6 +258,16 @@ class SummaryGeneratorV2:
         
         logger.debug(f"Episode {episode_number} prompt length: {len(prompt)} characters")
         
+        # Identical prompt (e.g. outputs regenerated for the same consultation)
+        # Only greedy decoding is deterministic enough to reuse
+        use_cache = temperature == 0
+        if use_cache:
+            cached = self._episode_cache.get(prompt)
+            if cached is not None:
+                self._episode_cache.move_to_end(prompt)
+                logger.info(f"Episode {episode_number} summary served from cache")
+                return cached
+        
         # Generate summary
         try:
             summary_text = self.hf_client.generate(
@@ -246,6 +279,11 @@ class SummaryGeneratorV2:
             # Clean up output
             summary_text = self._clean_summary(summary_text)
             
+            if use_cache:
+                self._episode_cache[prompt] = summary_text
+                if len(self._episode_cache) > self.EPISODE_CACHE_SIZE:
+                    self._episode_cache.popitem(last=False)
+            
             logger.info(f"Episode {episode_number} summary generated ({len(summary_text)} characters)")
             
             return summary_text
@@ -732,18 +770,16 @@ Generate the clinical summary for this episode now, starting with "In this episo
         text = summary_text.strip()
         
         if text.startswith("```"):
-            # Remove opening markdown
-            lines = text.split('\n')
-            if lines[0].startswith("```"):
-                lines = lines[1:]
+            # Remove opening markdown (slice at line boundaries, no line list)
+            first_newline = text.find('\n')
+            text = text[first_newline + 1:] if first_newline != -1 else ''
             # Remove closing markdown
-            if lines and lines[-1].startswith("```"):
-                lines = lines[:-1]
-            text = '\n'.join(lines)
+            last_newline = text.rfind('\n')
+            if text.startswith("```", last_newline + 1):
+                text = text[:last_newline] if last_newline != -1 else ''
         
-        # Remove extra blank lines (more than 2 consecutive)
-        while '\n\n\n' in text:
-            text = text.replace('\n\n\n', '\n\n')
+        # Remove extra blank lines (more than 2 consecutive) in one pass
+        text = _EXCESS_BLANK_LINES.sub('\n\n', text)
         
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -6,8 +6,15 @@ Append-only JSON files for audit trail and restart resilience.
 
 import json
 import logging
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+# Optional fast path: orjson serializes in C. Falls back to stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # When copying to local, adjust to: from backend.commands import ConsultationState
 from backend.commands import ConsultationState
@@ -15,6 +22,20 @@ from backend.commands import ConsultationState
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize types the JSON encoders don't handle natively.
+    
+    Sets are emitted as sorted lists (deterministic turn files), enums
+    by value. Shared by the orjson and stdlib json paths.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class ConsultationPersistence:
     """
     Manages turn-by-turn JSON persistence.
@@ -76,8 +97,18 @@ class ConsultationPersistence:
             )
         
         # Write (append-only means new files, never overwrite)
-        with open(filepath, 'w') as f:
-            json.dump(state.to_json(), f, indent=2, ensure_ascii=False)
+        # OPT_NON_STR_KEYS: dialogue_history is keyed by int episode_id
+        # (stdlib json converts those keys to strings implicitly)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    state.to_json(),
+                    default=_json_default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(state.to_json(), f, indent=2, ensure_ascii=False, default=_json_default)
         
         abs_path = str(filepath.absolute())
         logger.info(f"Saved turn {turn_count} for {consultation_id}: {filename}")
@@ -114,8 +145,11 @@ class ConsultationPersistence:
         logger.info(f"Loading latest turn for {consultation_id}: {latest_file.name}")
         
         # Load and wrap
-        with open(latest_file, 'r') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(latest_file.read_bytes())
+        else:
+            with open(latest_file, 'r') as f:
+                data = json.load(f)
         
         return ConsultationState.from_json(data)
     
@@ -59,4 +59,4 @@ class ConversationMode(str, Enum):
 
 # Single source of truth for valid mode strings
 # Used by StateManager for validation (fail-fast on corruption)
-VALID_MODES = {mode.value for mode in ConversationMode}
\ No newline at end of file
+VALID_MODES = frozenset(mode.value for mode in ConversationMode)
\ No newline at end of file
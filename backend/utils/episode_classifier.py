@@ -24,11 +24,17 @@ Examples:
     Collection item field: 'name' (inside medications array, not routed)
 """
 
-from typing import Literal
+import contextlib
+import contextvars
+import functools
+from typing import Iterator, Literal, Optional
+
+# Registries are frozensets: validated once at import, so they must not change
+# afterwards (a later mutation would bypass the disjointness check)
 
 # Episode-specific prefixes
 # Each represents a symptom category or section within an episode
-EPISODE_PREFIXES = {
+EPISODE_PREFIXES = frozenset({
     'vl_',   # vision loss
     'cp_',   # color perception
     'vp_',   # visual phenomena (flashing lights, zigzags)
@@ -47,30 +53,37 @@ EPISODE_PREFIXES = {
     'b4_',   # follow-up block 4
     'b5_',   # follow-up block 5
     'b6_',   # follow-up block 6
-}
+})
 
 # Shared data prefixes
 # Fields with these prefixes are shared across all episodes
-SHARED_PREFIXES = {
+SHARED_PREFIXES = frozenset({
     'sh_',  # social history (smoking, alcohol, drugs, occupation)
     'sr_',  # systems review (sr_gen_, sr_neuro_, sr_cardio_, etc.)
-}
+})
 
 # Collection fields (arrays)
 # These are routed as shared data by exact key match
 # Item fields inside these arrays use local names (e.g., 'name', not 'med_name')
-COLLECTION_FIELDS = {
+COLLECTION_FIELDS = frozenset({
     'medications',
     'past_medical_history',
     'family_history',
     'allergies'
-}
+})
 
 # Strict mode: whether to raise ValueError on unknown fields
 # If False, unknown fields return 'unknown' (logged but accepted)
 # If True, unknown fields raise ValueError (fail fast)
+# Process-wide default, set with set_strict_mode() (e.g. at startup)
 STRICT_MODE = False
 
+# Scoped override set by strict_mode(); None falls back to STRICT_MODE.
+# Held in a ContextVar so concurrent sessions/tests cannot flip it for each other
+_STRICT_MODE_OVERRIDE: contextvars.ContextVar[Optional[bool]] = contextvars.ContextVar(
+    'episode_classifier_strict_mode', default=None
+)
+
 
 def _validate_prefix_sets():
     """
@@ -79,12 +92,24 @@ def _validate_prefix_sets():
     Configuration errors must fail at load, not at runtime.
     
     Checks:
+    - Every prefix is a single segment ending in '_' (e.g. 'vl_', not 'vl_x_')
     - Episode and shared prefixes do not overlap
     - Collection fields do not match any prefix
     
     Raises:
         RuntimeError: If configuration error detected
     """
+    # Check prefix shape (classify_field looks prefixes up by first segment)
+    malformed = sorted(
+        p for p in EPISODE_PREFIXES | SHARED_PREFIXES
+        if not p.endswith('_') or p.count('_') != 1
+    )
+    if malformed:
+        raise RuntimeError(
+            f"Malformed prefixes: {malformed}. "
+            f"Prefixes must be a single segment ending in '_'."
+        )
+    
     # Check prefix overlap
     prefix_overlap = EPISODE_PREFIXES & SHARED_PREFIXES
     if prefix_overlap:
@@ -112,6 +137,36 @@ def _validate_prefix_sets():
 _validate_prefix_sets()
 
 
+# Prefix -> classification. Prefixes are single segments ending in '_', so a
+# field's prefix is everything up to its first underscore: one dict lookup
+# regardless of how many prefixes are registered.
+_PREFIX_CLASSIFICATION = {
+    **{prefix: 'episode' for prefix in EPISODE_PREFIXES},
+    **{prefix: 'shared' for prefix in SHARED_PREFIXES},
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_cached(field_name: str) -> Literal['episode', 'shared', 'unknown']:
+    """
+    Pure routing lookup, memoized per field name.
+    
+    Strict mode is applied by classify_field() outside the cache, so
+    toggling it never serves a stale result. Bounded because field names
+    come from LLM output, not only the schema.
+    """
+    # Prefix lookup on the first segment (includes the underscore)
+    classification = _PREFIX_CLASSIFICATION.get(field_name[:field_name.find('_') + 1])
+    if classification is not None:
+        return classification
+    
+    # Check collection fields (exact match only)
+    if field_name in COLLECTION_FIELDS:
+        return 'shared'
+    
+    return 'unknown'
+
+
 def classify_field(field_name: str) -> Literal['episode', 'shared', 'unknown']:
     """
     Classify a field by prefix matching.
@@ -122,7 +177,7 @@ def classify_field(field_name: str) -> Literal['episode', 'shared', 'unknown']:
     3. If field is collection key -> 'shared'
     4. Otherwise -> 'unknown'
     
-    Ambiguous matches (multiple rules apply) raise ValueError.
+    Ambiguous matches cannot occur: registries are validated disjoint at import.
     
     Args:
         field_name: Field name to classify
@@ -133,8 +188,7 @@ def classify_field(field_name: str) -> Literal['episode', 'shared', 'unknown']:
         'unknown': Field not recognized (logged, quarantined, or raised)
         
     Raises:
-        ValueError: If ambiguous routing detected (multiple matches)
-        ValueError: If unknown field and STRICT_MODE is True
+        ValueError: If unknown field and strict mode is enabled
         
     Examples:
         >>> classify_field('vl_laterality')
@@ -150,35 +204,17 @@ def classify_field(field_name: str) -> Literal['episode', 'shared', 'unknown']:
         'shared'
         
         >>> classify_field('unknown_field')
-        'unknown'  # or raises ValueError if STRICT_MODE=True
+        'unknown'  # or raises ValueError in strict mode
     """
-    matches = []
-    
-    # Check episode prefixes
-    if any(field_name.startswith(p) for p in EPISODE_PREFIXES):
-        matches.append('episode')
-    
-    # Check shared prefixes
-    if any(field_name.startswith(p) for p in SHARED_PREFIXES):
-        matches.append('shared')
-    
-    # Check collection fields (exact match only)
-    if field_name in COLLECTION_FIELDS:
-        matches.append('shared')
-    
-    # Validate single match
-    if len(matches) == 1:
-        return matches[0]
-    
-    if len(matches) > 1:
-        raise ValueError(
-            f"Ambiguous field routing for '{field_name}': "
-            f"matches {matches}. "
-            f"Fix prefix registries to ensure disjoint sets."
-        )
+    classification = _classify_cached(field_name)
+    if classification != 'unknown':
+        return classification
     
-    # Unknown field
-    if STRICT_MODE:
+    # Unknown field (scoped override wins over the process-wide default)
+    strict = _STRICT_MODE_OVERRIDE.get()
+    if strict is None:
+        strict = STRICT_MODE
+    if strict:
         raise ValueError(
             f"Unknown field '{field_name}' not matched by any prefix or collection. "
             f"Add appropriate prefix to EPISODE_PREFIXES or SHARED_PREFIXES, "
@@ -246,9 +282,34 @@ def set_strict_mode(enabled: bool) -> None:
     """
     Enable or disable strict mode for unknown fields.
     
+    Sets the process-wide default seen by every thread. Use strict_mode()
+    for a scoped override that only applies to the current context.
+    
     Args:
         enabled: If True, unknown fields raise ValueError.
                  If False, unknown fields return 'unknown'.
     """
     global STRICT_MODE
-    STRICT_MODE = enabled
\ No newline at end of file
+    STRICT_MODE = enabled
+
+
+@contextlib.contextmanager
+def strict_mode(enabled: bool = True) -> Iterator[None]:
+    """
+    Temporarily override strict mode, restoring the previous value on exit.
+    
+    The override applies to the current context only (thread or asyncio
+    task) and takes precedence over the set_strict_mode() default.
+    
+    Args:
+        enabled: Strict mode value inside the block
+        
+    Example:
+        >>> with strict_mode():
+        ...     classify_field('unknown_field')  # raises ValueError
+    """
+    token = _STRICT_MODE_OVERRIDE.set(enabled)
+    try:
+        yield
+    finally:
+        _STRICT_MODE_OVERRIDE.reset(token)
\ No newline at end of file
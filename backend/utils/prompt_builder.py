@@ -42,6 +42,29 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# Static PRIMARY prompt scaffold, assembled once at import
+_PRIMARY_SYSTEM_ROLE = "You are a medical data extractor for ophthalmology consultations.\n\n"
+
+_ADDITIONAL_FIELDS_HEADER = (
+    "\nADDITIONAL CONTEXT - You may also extract these fields if clearly mentioned:\n"
+)
+
+_OUTPUT_INSTRUCTIONS = (
+    "Extract any relevant fields from the patient's response.\n"
+    "Return ONLY valid JSON using the Field ID as the key:\n"
+    "{\n"
+)
+
+_RULES_AFTER_PRIMARY_FOCUS = (
+    "- You MAY extract additional fields if clearly mentioned\n"
+    "- If the patient response does not clearly contain extractable information for the listed fields, return {}\n"
+    "- Do not guess. Do not infer.\n"
+    "- Use exact Field IDs as JSON keys\n"
+    "- For categorical fields, use exact valid values\n"
+    "- For boolean fields, use true or false (lowercase, no quotes)\n"
+)
+
+
 class PromptBuildError(Exception):
     """Raised when prompt cannot be built due to invalid/incomplete spec"""
     pass
@@ -249,62 +272,60 @@ class PromptBuilder:
         """
         primary = spec.primary_field
         
+        # Collected as parts and joined once (static text comes from module constants)
         # System role
-        prompt = "You are a medical data extractor for ophthalmology consultations.\n\n"
+        parts = [_PRIMARY_SYSTEM_ROLE]
         
         # Primary field section
-        prompt += "PRIMARY FIELD\n"
-        prompt += f"Field ID: {primary.field_id}\n"
-        prompt += f"Meaning: {primary.label}\n"
-        prompt += f"Description: {primary.description}\n"
-        prompt += f"Type: {primary.field_type.value}\n"
+        parts.append(
+            "PRIMARY FIELD\n"
+            f"Field ID: {primary.field_id}\n"
+            f"Meaning: {primary.label}\n"
+            f"Description: {primary.description}\n"
+            f"Type: {primary.field_type.value}\n"
+        )
         
         # Add valid values and definitions for categorical
         if primary.field_type == FieldType.CATEGORICAL:
-            prompt += "Valid values:\n"
+            parts.append("Valid values:\n")
+            definitions = primary.definitions or {}
             for value in primary.valid_values:
-                if primary.definitions and value in primary.definitions:
-                    definition = primary.definitions[value]
-                    prompt += f"  - {value} ({definition})\n"
+                if value in definitions:
+                    parts.append(f"  - {value} ({definitions[value]})\n")
                 else:
-                    prompt += f"  - {value}\n"
+                    parts.append(f"  - {value}\n")
         
         # Additional fields section
-        if spec.additional_fields and len(spec.additional_fields) > 0:
-            prompt += "\nADDITIONAL CONTEXT - You may also extract these fields if clearly mentioned:\n"
+        if spec.additional_fields:
+            parts.append(_ADDITIONAL_FIELDS_HEADER)
             
             for field in spec.additional_fields:
-                prompt += f"  - Field ID: {field.field_id}\n"
-                prompt += f"    Meaning: {field.label}\n"
-                prompt += f"    Type: {field.field_type.value}\n"
+                parts.append(
+                    f"  - Field ID: {field.field_id}\n"
+                    f"    Meaning: {field.label}\n"
+                    f"    Type: {field.field_type.value}\n"
+                )
                 
                 if field.field_type == FieldType.CATEGORICAL:
-                    values_str = ", ".join(field.valid_values)
-                    prompt += f"    Valid values: {values_str}\n"
+                    parts.append(f"    Valid values: {', '.join(field.valid_values)}\n")
                 
-                prompt += "\n"
+                parts.append("\n")
         
         # Patient response
-        prompt += f"\nPatient response: \"{patient_response}\"\n\n"
+        parts.append(f"\nPatient response: \"{patient_response}\"\n\n")
         
         # Output format and rules
-        prompt += "Extract any relevant fields from the patient's response.\n"
-        prompt += f"Return ONLY valid JSON using the Field ID as the key:\n"
-        prompt += "{\n"
-        prompt += f'  "{primary.field_id}": "value",\n'
-        prompt += f'  "other_field_id": "value"\n'
-        prompt += "}\n\n"
-        
-        prompt += "Rules:\n"
-        prompt += f"- PRIMARY focus on {primary.field_id}\n"
-        prompt += "- You MAY extract additional fields if clearly mentioned\n"
-        prompt += "- If the patient response does not clearly contain extractable information for the listed fields, return {}\n"
-        prompt += "- Do not guess. Do not infer.\n"
-        prompt += "- Use exact Field IDs as JSON keys\n"
-        prompt += "- For categorical fields, use exact valid values\n"
-        prompt += "- For boolean fields, use true or false (lowercase, no quotes)\n"
-        
-        return prompt
+        parts.append(_OUTPUT_INSTRUCTIONS)
+        parts.append(
+            f'  "{primary.field_id}": "value",\n'
+            '  "other_field_id": "value"\n'
+            "}\n\n"
+            "Rules:\n"
+            f"- PRIMARY focus on {primary.field_id}\n"
+        )
+        parts.append(_RULES_AFTER_PRIMARY_FOCUS)
+        
+        return "".join(parts)
 
 
 # =============================================================================
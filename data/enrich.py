@@ -32,6 +32,18 @@ PREFIX_EXPANSIONS = {
     'func_': 'functional impact',
 }
 
+# Longest prefix first so overlapping prefixes (e.g. 'h_' vs 'hall_')
+# resolve to the most specific match regardless of dict order
+_PREFIX_TUPLE: Tuple[Tuple[str, str], ...] = tuple(
+    sorted(PREFIX_EXPANSIONS.items(), key=lambda kv: -len(kv[0]))
+)
+
+assert all(
+    not later.startswith(earlier)
+    for i, (earlier, _) in enumerate(_PREFIX_TUPLE)
+    for later, _ in _PREFIX_TUPLE[i + 1:]
+), "_PREFIX_TUPLE must be ordered longest-prefix-first"
+
 
 def expand_field_name(field_name: str) -> str:
     """
@@ -48,8 +60,8 @@ def expand_field_name(field_name: str) -> str:
     Returns:
         Expanded field label (e.g., 'visual loss present')
     """
-    # Check each prefix
-    for prefix, expansion in PREFIX_EXPANSIONS.items():
+    # Check each prefix (longest first)
+    for prefix, expansion in _PREFIX_TUPLE:
         if field_name.startswith(prefix):
             # Replace prefix with expansion
             # e.g., 'vl_present' -> 'present', then prepend 'visual loss'
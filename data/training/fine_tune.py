@@ -9,6 +9,7 @@ Training configuration:
 - LoRA rank: 16
 - Learning rate: 2e-4
 - Batch size: 1 (gradient accumulation: 4)
+- torch.compile: opt-in via TORCH_COMPILE=1
 
 Expected runtime: ~30 minutes on RTX 5070
 Expected VRAM: ~10-11GB peak
@@ -28,10 +29,9 @@ from transformers import (
     AutoModelForCausalLM,
     AutoTokenizer,
     BitsAndBytesConfig,
-    TrainingArguments
 )
 from peft import LoraConfig, get_peft_model, prepare_model_for_kbit_training
-from trl import SFTTrainer
+from trl import SFTConfig, SFTTrainer
 from datasets import load_dataset
 
 
@@ -176,7 +176,7 @@ def setup_training_args(output_dir, num_epochs=2):
         num_epochs: Number of training epochs
     
     Returns:
-        TrainingArguments
+        SFTConfig
     """
     print("="*60)
     print("TRAINING CONFIGURATION")
@@ -186,9 +186,21 @@ def setup_training_args(output_dir, num_epochs=2):
     print(f"Gradient accumulation: 4 steps (effective batch size: 4)")
     print(f"Learning rate: 2e-4")
     print(f"Output: {output_dir}")
+    
+    # torch.compile is opt-in: inductor can fail on some quantized/LoRA ops
+    use_torch_compile = os.environ.get("TORCH_COMPILE") == "1"
+    print(f"torch.compile: {'enabled (inductor, reduce-overhead)' if use_torch_compile else 'disabled'}")
     print()
     
-    training_args = TrainingArguments(
+    compile_kwargs = {}
+    if use_torch_compile:
+        compile_kwargs = {
+            "torch_compile": True,
+            "torch_compile_mode": "reduce-overhead",
+            "torch_compile_backend": "inductor",
+        }
+    
+    training_args = SFTConfig(
         output_dir=output_dir,
         num_train_epochs=num_epochs,
         per_device_train_batch_size=1,
@@ -205,6 +217,8 @@ def setup_training_args(output_dir, num_epochs=2):
         bf16=True,  # RTX 5070 supports bfloat16
         optim="paged_adamw_8bit",  # Memory-efficient optimizer
         report_to="none",  # No external logging
+        dataset_text_field="text",  # Pre-formatted by format_instruction
+        **compile_kwargs,
     )
     
     return training_args
@@ -270,11 +284,6 @@ def main():
     print("INITIALIZING TRAINER")
     print("="*60)
     
-    # Define formatting function to extract 'text' field from examples
-    def formatting_func(example):
-        """Extract the 'text' field from formatted examples"""
-        return example['text']
-    
     trainer = SFTTrainer(
         model=model,
         args=training_args,
@@ -282,7 +291,6 @@ def main():
         eval_dataset=val_dataset,
         processing_class=tokenizer,
         peft_config=lora_config,
-        formatting_func=formatting_func,
     )
     print("Trainer initialized")
     print()
@@ -92,7 +92,7 @@ Old snapshots missing `questions_satisfied`:
 ---
 
 ## Field-Level Provenance (V3)
-- **Storage:** Parallel structure in `_provenance` dict (episode and shared_data)
+- **Storage:** Per-owner index `_provenance: {owner: {field_name: record}}` (owner = episode_id, or `SHARED_PROVENANCE_OWNER` = 0 for shared_data); exports attach each owner's records as the per-episode / shared `_provenance` dict
 - **Schema:** Each field has provenance record with:
   - `source`: str (response_parser | clarification_parser | forced_resolution | user_explicit | derived | clarification_replay | system | default)
   - `confidence`: str (high | medium | low) - qualitative bands, not calibrated probabilities
@@ -172,7 +172,7 @@ class ClarificationTurn:
 - **Includes:** All episodes, shared_data, dialogue_history, operational fields (questions_answered, questions_satisfied), **filtered provenance (source + confidence only)**
 - **Excludes:** clarification_context, **provenance mode field** (orchestration internal)
 - **Provenance filtering:** Enables phrasing like "The patient reports..." vs "It is unclear whether..."
-- **Mutation-safe:** Deep-copies before filtering to prevent state corruption
+- **Mutation-safe:** Filters on a shallow copy of already-serialized data (no repeated deep copy)
 - **Used by:** Summary Generator
 
 ---
@@ -196,9 +196,13 @@ add_dialogue_turn(episode_id, question_id, question_text, response, extracted)
 
 create_episode()
 # Creates new episode with auto-incremented ID
-# V3: Initializes empty _provenance dict
+# V3: Provenance lives in the per-owner index (not in the episode dict)
 # V4: Initializes empty questions_satisfied set
 # Returns new episode_id
+
+begin_turn() / end_turn()
+# Called by DialogueManager around each command's writes
+# Writes inside a turn share one timestamp; outside a turn each write takes the current time
 ```
 
 ### Question Tracking Methods (V4)
@@ -244,6 +248,7 @@ clear_clarification_context()
 get_episode_for_selector(episode_id) -> dict
 # Returns episode data including operational fields (questions_answered, 
 # questions_satisfied, follow-up blocks) and full provenance
+# Tracking sets are frozensets; _provenance is a read-only MappingProxyType of read-only records
 # Used by Question Selector
 
 from_snapshot(snapshot_dict) -> StateManager
@@ -262,12 +267,12 @@ _validate_provenance(provenance)
 # Enforces mode is ConversationMode enum (NOT string)
 
 _default_provenance() -> ProvenanceRecord
-# Generates default: {source: 'default', confidence: 'low', mode: current_mode}
+# Returns shared prebuilt default: {source: 'default', confidence: 'low', mode: current_mode}
 
 _apply_weakest_link_confidence(existing, new) -> ProvenanceRecord
 # Degrades confidence for collection updates (never improves)
 
-_store_provenance(provenance_dict, field_name, provenance, is_collection)
+_store_provenance(owner, field_name, provenance, is_collection)
 # Last-writer-wins storage with weakest-link for collections
 
 _serialize_provenance_dict(provenance_dict) -> dict
@@ -278,7 +283,7 @@ _deserialize_provenance_dict(provenance_dict) -> dict
 
 _filter_provenance_for_summary(data) -> dict
 # Strips mode field, keeps source + confidence
-# CRITICAL: Deep-copies input before mutation (prevents state corruption)
+# CRITICAL: Never mutates input (shallow copy, only '_provenance' is rebound)
 ```
 
 ### Validation Methods
@@ -301,8 +306,8 @@ _validate_conversation_mode(mode)
   - `questions_satisfied`: set[str] - questions with data obtained (V4)
   - `follow_up_blocks_activated`: set[str]
   - `follow_up_blocks_completed`: set[str]
-  - `_provenance`: dict[str, ProvenanceRecord] (V3)
-- Shared data also has _provenance dict (V3)
+  - `_provenance`: dict[str, ProvenanceRecord] (V3, attached on export from the per-owner index)
+- Shared data exports also carry a _provenance dict (V3)
 - Conversation mode stored as ConversationMode enum internally (string only at JSON boundary)
 - Provenance mode must be ConversationMode enum (TypeError if string)
 - Confidence is qualitative band (high|medium|low), not calibrated probability
@@ -2,19 +2,19 @@
 Console Test Harness for DialogueManagerV2 (Functional Core)
 
 Simple console loop to test handle_turn() before adding Flask complexity.
+
+Usage:
+    python main.py            # one-line error reports
+    python main.py --debug    # full tracebacks on errors
 """
 
+import argparse
 import logging
 import sys
+import traceback
 
-# Flat imports for server testing
-from backend.core.state_manager_v2 import StateManagerV2
-from backend.core.question_selector_v2 import QuestionSelectorV2
-from backend.core.response_parser_v2 import ResponseParserV2
-from backend.core.json_formatter_v2 import JSONFormatterV2
-from backend.core.summary_generator_v2 import SummaryGeneratorV2
-from backend.core.dialogue_manager_v2 import DialogueManagerV2
-from backend.utils.hf_client_v2 import HuggingFaceClient
+# Backend modules are imported inside main(): they transitively pull in
+# torch/transformers/bitsandbytes, which --help and test imports don't need.
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +23,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared fallback for missing parse_metadata (read-only, never mutated)
+_EMPTY_METADATA = {}
+
 
 def print_separator(char="=", length=60):
     """Print a separator line"""
@@ -43,14 +46,16 @@ def print_debug_info(turn_result):
         print(f"Parser outcome: {parser.get('outcome', 'N/A')}")
         print(f"Fields extracted: {parser.get('fields', {})}")
         
-        if parser.get('parse_metadata', {}).get('unexpected_fields'):
-            print(f"Unexpected fields: {parser['parse_metadata']['unexpected_fields']}")
+        meta = parser.get('parse_metadata') or _EMPTY_METADATA
+        
+        if meta.get('unexpected_fields'):
+            print(f"Unexpected fields: {meta['unexpected_fields']}")
         
-        if parser.get('parse_metadata', {}).get('validation_warnings'):
-            print(f"Validation warnings: {parser['parse_metadata']['validation_warnings']}")
+        if meta.get('validation_warnings'):
+            print(f"Validation warnings: {meta['validation_warnings']}")
         
-        if parser.get('parse_metadata', {}).get('normalization_applied'):
-            print(f"Normalization applied: {parser['parse_metadata']['normalization_applied']}")
+        if meta.get('normalization_applied'):
+            print(f"Normalization applied: {meta['normalization_applied']}")
     
     # Other debug info
     if 'episode_complete' in debug:
@@ -65,14 +70,44 @@ def print_debug_info(turn_result):
     print("-" * 60)
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    arg_parser = argparse.ArgumentParser(description="DialogueManagerV2 console test harness")
+    arg_parser.add_argument(
+        '--debug',
+        action='store_true',
+        help="Print full tracebacks on errors"
+    )
+    return arg_parser.parse_args(argv)
+
+
+def report_error(message, debug):
+    """Report an exception: full traceback in debug mode, one log line otherwise"""
+    if debug:
+        traceback.print_exc()
+    else:
+        logger.error(f"{message} (run with --debug for traceback)")
+
+
+def main(argv=None):
     """Run console test"""
+    args = parse_args(argv)
+    
     print_separator()
     print("DIALOGUE MANAGER V2 - CONSOLE TEST")
     print_separator()
     print("\nInitializing modules (this may take 30 seconds)...")
     
     try:
+        # Flat imports for server testing (deferred, see module note)
+        from backend.core.state_manager_v2 import StateManagerV2
+        from backend.core.question_selector_v2 import QuestionSelectorV2
+        from backend.core.response_parser_v2 import ResponseParserV2
+        from backend.core.json_formatter_v2 import JSONFormatterV2
+        from backend.core.summary_generator_v2 import SummaryGeneratorV2
+        from backend.core.dialogue_manager_v2 import DialogueManagerV2
+        from backend.utils.hf_client_v2 import HuggingFaceClient
+        
         # Initialize HuggingFace client (expensive - only once)
         hf_client = HuggingFaceClient(
             model_name="mistralai/Mistral-7B-Instruct-v0.2",
@@ -98,8 +133,7 @@ def main():
         
     except Exception as e:
         print(f"\nFailed to initialize: {e}")
-        import traceback
-        traceback.print_exc()
+        report_error("initialization failed", args.debug)
         return 1
     
     # Consultation loop
@@ -173,8 +207,7 @@ def main():
             
         except Exception as e:
             print(f"\nERROR: {e}")
-            import traceback
-            traceback.print_exc()
+            report_error("turn failed", args.debug)
             
             # Ask if user wants to continue
             try:
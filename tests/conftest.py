@@ -0,0 +1,33 @@
+"""
+Shared pytest fixtures.
+
+Run from project root:
+    pytest tests/
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def hf_client_mistral_4bit():
+    """
+    Load real HuggingFace client (expensive - once per test session).
+    
+    Shared by every test module that needs the real model so the
+    weights are loaded into GPU memory only once per run.
+    """
+    torch = pytest.importorskip("torch")
+    if not torch.cuda.is_available():
+        pytest.skip("CUDA GPU required for real HF client")
+    
+    from backend.utils.hf_client_v2 import HuggingFaceClient
+    
+    try:
+        client = HuggingFaceClient(
+            model_name="mistralai/Mistral-7B-Instruct-v0.2",
+            load_in_4bit=True
+        )
+    except Exception as e:
+        pytest.skip(f"Could not load HF client: {e}")
+    
+    yield client
@@ -4,8 +4,12 @@ Unit tests for Dialogue Manager V2 (Multi-Episode)
 Tests orchestration logic with mocked dependencies
 """
 
+import io
 import sys
 import os
+import tempfile
+from collections import deque
+from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.core.dialogue_manager_v2 import DialogueManagerV2, ConsultationState
@@ -78,27 +82,46 @@ class MockQuestionSelector:
         return question
 
 
+# Recognized answers to the episode transition question
+TRANSITION_ANSWERS = {
+    'yes': True, 'y': True, 'yeah': True, 'yep': True,
+    'no': False, 'n': False, 'nope': False,
+}
+
+
 class MockResponseParser:
     """Mock Response Parser with controlled extraction"""
     
-    def __init__(self, extractions=None):
+    def __init__(self, extractions=None, transition_answers=None):
         """
         Args:
             extractions: Dict mapping question_id -> extracted fields
                         If None, returns empty dict for all questions
+            transition_answers: Dict mapping normalized response -> bool for
+                        the episode transition question (e.g. TRANSITION_ANSWERS).
+                        If None, the transition question uses extractions too
         """
         self.extractions = extractions or {}
+        self.transition_answers = transition_answers
+        self._quit_responses = frozenset(('quit', 'exit', 'stop'))
+        self._extractions_get = self.extractions.get
     
     def parse(self, question, patient_response):
         """Return predefined extraction for question_id"""
-        question_id = question.get('id')
+        question_id = question['id']
+        response_lower = patient_response.lower()
         
-        # Check for special responses
-        if patient_response.lower() in ['quit', 'exit', 'stop']:
-            return {}
+        # Episode transition: classify yes/no, anything else is unclear
+        if question_id == 'episode_transition' and self.transition_answers is not None:
+            answer = self.transition_answers.get(response_lower.strip())
+            if answer is None:
+                return {}
+            return {'additional_episodes_present': answer}
         
-        # Return predefined extraction
-        return self.extractions.get(question_id, {})
+        # Special responses extract nothing, otherwise predefined extraction
+        if response_lower in self._quit_responses:
+            return {}
+        return self._extractions_get(question_id, {})
 
 
 class MockJSONFormatter:
@@ -163,12 +186,12 @@ def create_input_function(responses):
     Returns:
         Function that acts like input()
     """
-    responses_iter = iter(responses)
+    next_response = deque(responses).popleft
     
     def mock_input(prompt=""):
         try:
-            return next(responses_iter)
-        except StopIteration:
+            return next_response()
+        except IndexError:
             raise EOFError("No more responses")
     
     return mock_input
@@ -179,12 +202,14 @@ def create_output_collector():
     Create output function that collects output
     
     Returns:
-        tuple: (output_function, list_to_collect_output)
+        tuple: (output_function, StringIO buffer; read with getvalue())
     """
-    collected = []
+    collected = io.StringIO()
+    write = collected.write
     
     def mock_output(text):
-        collected.append(str(text))
+        write(str(text))
+        write('\n')
     
     return mock_output, collected
 
@@ -217,7 +242,7 @@ def test_initialization():
     print("✓ Initialization test passed")
 
 
-def test_field_routing_episode_fields():
+def test_field_routing_episode_fields(tmp_path):
     """Test episode-specific fields route to correct episode"""
     questions = [
         {'id': 'vl_1', 'question': 'Which eye?', 'field': 'vl_laterality'}
@@ -234,7 +259,7 @@ def test_field_routing_episode_fields():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check field routed to episode
     episode = manager.state.get_episode(1)
@@ -244,7 +269,7 @@ def test_field_routing_episode_fields():
     print("✓ Episode field routing test passed")
 
 
-def test_field_routing_shared_fields():
+def test_field_routing_shared_fields(tmp_path):
     """Test shared fields route to shared data"""
     questions = [
         {'id': 'meds_1', 'question': 'Medications?', 'field': 'medications'}
@@ -261,7 +286,7 @@ def test_field_routing_shared_fields():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check field routed to shared data
     assert 'medications' in manager.state.shared_data
@@ -270,7 +295,7 @@ def test_field_routing_shared_fields():
     print("✓ Shared field routing test passed")
 
 
-def test_unmapped_fields_quarantined():
+def test_unmapped_fields_quarantined(tmp_path):
     """Test unmapped fields stored in dialogue metadata"""
     questions = [
         {'id': 'q1', 'question': 'Test?', 'field': 'test_field'}
@@ -290,7 +315,7 @@ def test_unmapped_fields_quarantined():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check unmapped field in dialogue metadata
     dialogue = manager.state.dialogue_history[1][0]
@@ -304,7 +329,7 @@ def test_unmapped_fields_quarantined():
     print("✓ Unmapped field quarantine test passed")
 
 
-def test_episode_creation_first_episode():
+def test_episode_creation_first_episode(tmp_path):
     """Test Episode 1 created at start"""
     questions = [
         {'id': 'q1', 'question': 'Test?', 'field': 'test'}
@@ -317,7 +342,7 @@ def test_episode_creation_first_episode():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check Episode 1 created
     assert manager.state.get_episode_count() == 1
@@ -327,7 +352,7 @@ def test_episode_creation_first_episode():
     print("✓ First episode creation test passed")
 
 
-def test_episode_transition_clear_yes():
+def test_episode_transition_clear_yes(tmp_path):
     """Test new episode created on clear 'yes' response"""
     
     # Create custom selector that respects episode boundaries
@@ -360,34 +385,18 @@ def test_episode_transition_clear_yes():
         def start_episode_2(self):
             self.episode = 2
     
-    # Create smart parser that looks at actual response text for transitions
-    class SmartParser:
-        def __init__(self):
-            self.extractions = {
-                'q1': {'vl_laterality': 'monocular_right'},
-                'q2': {'h_present': True}
-            }
-        
-        def parse(self, question, patient_response):
-            question_id = question.get('id')
-            
-            # Handle episode transition specially
-            if question_id == 'episode_transition':
-                response_lower = patient_response.lower().strip()
-                if response_lower in ['yes', 'y', 'yeah', 'yep']:
-                    return {'additional_episodes_present': True}
-                elif response_lower in ['no', 'n', 'nope']:
-                    return {'additional_episodes_present': False}
-                else:
-                    return {}  # Unclear
-            
-            # Regular question
-            return self.extractions.get(question_id, {})
+    # Parser that looks at actual response text for transitions
+    parser = MockResponseParser(
+        extractions={
+            'q1': {'vl_laterality': 'monocular_right'},
+            'q2': {'h_present': True}
+        },
+        transition_answers=TRANSITION_ANSWERS
+    )
     
     # Create manager
     state = MockStateManagerV2()
     selector = TwoEpisodeSelector()
-    parser = SmartParser()
     formatter = MockJSONFormatter()
     generator = MockSummaryGenerator()
     
@@ -418,7 +427,7 @@ def test_episode_transition_clear_yes():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check 2 episodes created
     assert state.get_episode_count() == 2, f"Expected 2 episodes, got {state.get_episode_count()}"
@@ -427,7 +436,7 @@ def test_episode_transition_clear_yes():
     print("✓ Episode transition (yes) test passed")
 
 
-def test_episode_transition_clear_no():
+def test_episode_transition_clear_no(tmp_path):
     """Test no new episode on clear 'no' response"""
     questions = [
         {'id': 'q1', 'question': 'Question 1?', 'field': 'field1'}
@@ -465,7 +474,7 @@ def test_episode_transition_clear_no():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check only 1 episode
     assert state.get_episode_count() == 1
@@ -474,7 +483,7 @@ def test_episode_transition_clear_no():
     print("✓ Episode transition (no) test passed")
 
 
-def test_episode_transition_unclear_retry():
+def test_episode_transition_unclear_retry(tmp_path):
     """Test retry logic on unclear transition response"""
     questions = [
         {'id': 'q1', 'question': 'Question 1?', 'field': 'field1'}
@@ -526,19 +535,19 @@ def test_episode_transition_unclear_retry():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check retry happened (only 1 episode created)
     assert state.get_episode_count() == 1
     
     # Check retry message in output
-    output_text = ' '.join(output)
+    output_text = output.getvalue()
     assert "didn't quite catch that" in output_text.lower()
     
     print("✓ Episode transition retry test passed")
 
 
-def test_episode_transition_max_retries():
+def test_episode_transition_max_retries(tmp_path):
     """Test assumes 'no' after max retries"""
     questions = [
         {'id': 'q1', 'question': 'Question 1?', 'field': 'field1'}
@@ -580,19 +589,19 @@ def test_episode_transition_max_retries():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check assumed 'no' after max retries (only 1 episode)
     assert state.get_episode_count() == 1
     
     # Check assumption message in output
-    output_text = ' '.join(output)
+    output_text = output.getvalue()
     assert "assume" in output_text.lower()
     
     print("✓ Max retries test passed")
 
 
-def test_multiple_episodes_flow():
+def test_multiple_episodes_flow(tmp_path):
     """Test 3-episode consultation flow"""
     # Episode 1: 2 questions
     # Episode 2: 1 question
@@ -640,32 +649,20 @@ def test_multiple_episodes_flow():
         def advance_episode(self):
             self.episode += 1
     
-    # Smart parser
-    class SmartParser:
-        def parse(self, question, patient_response):
-            question_id = question.get('id')
-            
-            if question_id == 'episode_transition':
-                response_lower = patient_response.lower().strip()
-                if response_lower in ['yes', 'y']:
-                    return {'additional_episodes_present': True}
-                elif response_lower in ['no', 'n']:
-                    return {'additional_episodes_present': False}
-                return {}
-            
-            # Regular questions
-            extractions = {
-                'ep1_q1': {'vl_laterality': 'monocular_right'},
-                'ep1_q2': {'vl_onset_speed': 'acute'},
-                'ep2_q1': {'h_present': True},
-                'ep3_q1': {'ep_present': True}
-            }
-            return extractions.get(question_id, {})
+    # Parser that looks at actual response text for transitions
+    parser = MockResponseParser(
+        extractions={
+            'ep1_q1': {'vl_laterality': 'monocular_right'},
+            'ep1_q2': {'vl_onset_speed': 'acute'},
+            'ep2_q1': {'h_present': True},
+            'ep3_q1': {'ep_present': True}
+        },
+        transition_answers=TRANSITION_ANSWERS
+    )
     
     # Create manager
     state = MockStateManagerV2()
     selector = MultiEpisodeSelector()
-    parser = SmartParser()
     formatter = MockJSONFormatter()
     generator = MockSummaryGenerator()
     
@@ -699,7 +696,7 @@ def test_multiple_episodes_flow():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check 3 episodes created
     assert state.get_episode_count() == 3, f"Expected 3 episodes, got {state.get_episode_count()}"
@@ -709,7 +706,7 @@ def test_multiple_episodes_flow():
     print("✓ Multiple episodes flow test passed")
 
 
-def test_early_exit_command():
+def test_early_exit_command(tmp_path):
     """Test early exit via 'quit' command"""
     questions = [
         {'id': 'q1', 'question': 'Question 1?', 'field': 'field1'},
@@ -723,7 +720,7 @@ def test_early_exit_command():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check early exit
     assert result['completed'] == False
@@ -732,7 +729,7 @@ def test_early_exit_command():
     print("✓ Early exit test passed")
 
 
-def test_dialogue_history_per_episode():
+def test_dialogue_history_per_episode(tmp_path):
     """Test dialogue history tracked per episode"""
     questions = [
         {'id': 'ep1_q1', 'question': 'E1 Q1?', 'field': 'f1'},
@@ -798,7 +795,7 @@ def test_dialogue_history_per_episode():
     output_fn, output = create_output_collector()
     
     # Run consultation
-    result = manager.run_consultation(input_fn, output_fn, output_dir="/tmp")
+    result = manager.run_consultation(input_fn, output_fn, output_dir=str(tmp_path))
     
     # Check dialogue history separated by episode
     assert 1 in state.dialogue_history
@@ -816,17 +813,19 @@ if __name__ == '__main__':
     print("=" * 60)
     
     test_initialization()
-    test_field_routing_episode_fields()
-    test_field_routing_shared_fields()
-    test_unmapped_fields_quarantined()
-    test_episode_creation_first_episode()
-    test_episode_transition_clear_yes()
-    test_episode_transition_clear_no()
-    test_episode_transition_unclear_retry()
-    test_episode_transition_max_retries()
-    test_multiple_episodes_flow()
-    test_early_exit_command()
-    test_dialogue_history_per_episode()
+    with tempfile.TemporaryDirectory() as output_dir:
+        tmp_path = Path(output_dir)
+        test_field_routing_episode_fields(tmp_path)
+        test_field_routing_shared_fields(tmp_path)
+        test_unmapped_fields_quarantined(tmp_path)
+        test_episode_creation_first_episode(tmp_path)
+        test_episode_transition_clear_yes(tmp_path)
+        test_episode_transition_clear_no(tmp_path)
+        test_episode_transition_unclear_retry(tmp_path)
+        test_episode_transition_max_retries(tmp_path)
+        test_multiple_episodes_flow(tmp_path)
+        test_early_exit_command(tmp_path)
+        test_dialogue_history_per_episode(tmp_path)
     
     print("=" * 60)
     print("All Dialogue Manager V2 tests passed!\n")
\ No newline at end of file
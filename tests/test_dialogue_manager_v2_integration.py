@@ -4,14 +4,32 @@ Integration test for Dialogue Manager V2
 Tests with real State Manager V2, mocked other modules
 """
 
+import functools
+import io
 import sys
 import os
+import re
+import tempfile
+from collections import deque
+from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.core.dialogue_manager_v2 import DialogueManagerV2
 from backend.core.state_manager_v2 import StateManagerV2
 
 
+# Scripted patient responses for the two-episode consultation
+PATIENT_RESPONSES = (
+    'My right eye',  # vl_1 - laterality
+    '3 months ago',  # vl_2 - onset
+    'It was sudden',  # vl_3 - speed
+    'yes',  # Episode transition - create episode 2
+    'Yes I do',  # h_1 - headache present
+    'Front of my head',  # h_2 - location
+    'no'  # Final transition - no more episodes
+)
+
+
 # ========================
 # Mock Modules (from unit tests)
 # ========================
@@ -54,53 +72,75 @@ class MockQuestionSelector:
         self.current_index = 0
 
 
+# Keyword matchers compiled once; case-insensitive so responses aren't lowercased per turn
+# One scan classifies yes/no; the first keyword in the response wins
+_YES_NO = re.compile(r'\b(?:(?P<yes>yes|yeah|yep)|(?P<no>no|nope|nah))\b', re.IGNORECASE)
+_LATERALITY = re.compile(r'\b(right|left|both)\b', re.IGNORECASE)
+_SUDDEN = re.compile(r'sudden', re.IGNORECASE)
+_GRADUAL = re.compile(r'gradual|slowly', re.IGNORECASE)
+
+_LATERALITY_VALUES = {
+    'right': 'monocular_right',
+    'left': 'monocular_left',
+    'both': 'binocular',
+}
+
+
+def _parse_transition(response):
+    match = _YES_NO.search(response)
+    if match is None:
+        return {}  # Unclear
+    return {'additional_episodes_present': match.lastgroup == 'yes'}
+
+
+def _parse_laterality(response):
+    match = _LATERALITY.search(response)
+    if match:
+        return {'vl_laterality': _LATERALITY_VALUES[match.group(1).lower()]}
+    return {}
+
+
+def _parse_onset_speed(response):
+    if _SUDDEN.search(response):
+        return {'vl_onset_speed': 'acute'}
+    if _GRADUAL.search(response):
+        return {'vl_onset_speed': 'chronic'}
+    return {'vl_onset_speed': 'subacute'}
+
+
+def _parse_headache_present(response):
+    match = _YES_NO.search(response)
+    if match is None:
+        return {}
+    return {'h_present': match.lastgroup == 'yes'}
+
+
 class MockResponseParser:
     """Mock Response Parser with realistic extractions"""
     
+    # question_id -> handler(patient_response)
+    HANDLERS = {
+        'episode_transition': _parse_transition,
+        'vl_1': _parse_laterality,
+        'vl_2': lambda response: {'vl_first_onset': response},
+        'vl_3': _parse_onset_speed,
+        'h_1': _parse_headache_present,
+        'h_2': lambda response: {'h_location': response},
+    }
+    
     def parse(self, question, patient_response):
         """Extract fields based on question and response"""
-        question_id = question.get('id')
-        response_lower = patient_response.lower()
-        
-        # Handle episode transition
-        if question_id == 'episode_transition':
-            if any(word in response_lower for word in ['yes', 'yeah', 'yep']):
-                return {'additional_episodes_present': True}
-            elif any(word in response_lower for word in ['no', 'nope', 'nah']):
-                return {'additional_episodes_present': False}
-            return {}  # Unclear
-        
-        # Vision loss questions
-        if question_id == 'vl_1':
-            if 'right' in response_lower:
-                return {'vl_laterality': 'monocular_right'}
-            elif 'left' in response_lower:
-                return {'vl_laterality': 'monocular_left'}
-            elif 'both' in response_lower:
-                return {'vl_laterality': 'binocular'}
-        
-        elif question_id == 'vl_2':
-            # Extract onset time
-            return {'vl_first_onset': patient_response}
-        
-        elif question_id == 'vl_3':
-            if 'sudden' in response_lower:
-                return {'vl_onset_speed': 'acute'}
-            elif 'gradual' in response_lower or 'slowly' in response_lower:
-                return {'vl_onset_speed': 'chronic'}
-            return {'vl_onset_speed': 'subacute'}
-        
-        # Headache questions
-        elif question_id == 'h_1':
-            if 'yes' in response_lower:
-                return {'h_present': True}
-            elif 'no' in response_lower:
-                return {'h_present': False}
-        
-        elif question_id == 'h_2':
-            return {'h_location': patient_response}
-        
+        # Copy so callers may mutate the result without touching the cache
+        return dict(_parse_cached(question.get('id'), patient_response))
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(question_id, patient_response):
+    """Memoized extraction; the same (question, response) pairs recur across tests"""
+    handler = MockResponseParser.HANDLERS.get(question_id)
+    if handler is None:
         return {}
+    return handler(patient_response)
 
 
 class MockJSONFormatter:
@@ -125,7 +165,7 @@ class MockSummaryGenerator:
 # Integration Test
 # ========================
 
-def test_two_episode_consultation_with_real_state():
+def test_two_episode_consultation_with_real_state(tmp_path):
     """
     Full 2-episode flow with real State Manager V2
     
@@ -170,32 +210,23 @@ def test_two_episode_consultation_with_real_state():
         summary_generator=generator
     )
     
-    # Simulate patient responses
-    responses = [
-        'My right eye',  # vl_1 - laterality
-        '3 months ago',  # vl_2 - onset
-        'It was sudden',  # vl_3 - speed
-        'yes',  # Episode transition - create episode 2
-        'Yes I do',  # h_1 - headache present
-        'Front of my head',  # h_2 - location
-        'no'  # Final transition - no more episodes
-    ]
-    
-    # Create input function
-    responses_iter = iter(responses)
+    # Create input function (simulated patient responses)
+    next_response = deque(PATIENT_RESPONSES).popleft
     def mock_input(prompt=""):
-        return next(responses_iter)
+        return next_response()
     
-    # Collect output
-    output_log = []
+    # Collect output (read with output_buffer.getvalue())
+    output_buffer = io.StringIO()
+    write = output_buffer.write
     def mock_output(text):
-        output_log.append(str(text))
+        write(str(text))
+        write('\n')
     
     # Run consultation
     result = manager.run_consultation(
         input_fn=mock_input,
         output_fn=mock_output,
-        output_dir="/tmp"
+        output_dir=str(tmp_path)
     )
     
     # Verify results
@@ -251,4 +282,5 @@ def test_two_episode_consultation_with_real_state():
 
 
 if __name__ == '__main__':
-    test_two_episode_consultation_with_real_state()
\ No newline at end of file
+    with tempfile.TemporaryDirectory() as output_dir:
+        test_two_episode_consultation_with_real_state(Path(output_dir))
\ No newline at end of file
@@ -8,6 +8,9 @@ Tests:
 4. Episode transition with new contract
 """
 
+from backend.core.dialogue_manager_v2 import DialogueManagerV2
+
+
 class MockParser:
     """Mock parser that returns contract-compliant structure"""
     
@@ -59,11 +62,19 @@ class MockStateManager:
     def __init__(self):
         self.episodes = []
         self.dialogue_history = {}
+        self._next_episode_id = 1
+        self._episode_tracking = {}  # episode_id -> tracking sets
     
     def create_episode(self):
-        episode_id = len(self.episodes) + 1
+        episode_id = self._next_episode_id
+        self._next_episode_id += 1
         self.episodes.append({'episode_id': episode_id})
         self.dialogue_history[episode_id] = []
+        self._episode_tracking[episode_id] = {
+            'questions_answered': set(),
+            'follow_up_blocks_activated': set(),
+            'follow_up_blocks_completed': set()
+        }
         return episode_id
     
     def set_episode_field(self, episode_id, field_name, value):
@@ -73,21 +84,16 @@ class MockStateManager:
         pass
     
     def get_episode_for_selector(self, episode_id):
-        return {
-            'episode_id': episode_id,
-            'questions_answered': set(),
-            'follow_up_blocks_activated': set(),
-            'follow_up_blocks_completed': set()
-        }
+        return {'episode_id': episode_id, **self._episode_tracking[episode_id]}
     
     def mark_question_answered(self, episode_id, question_id):
-        pass
+        self._episode_tracking[episode_id]['questions_answered'].add(question_id)
     
     def activate_follow_up_block(self, episode_id, block_id):
-        pass
+        self._episode_tracking[episode_id]['follow_up_blocks_activated'].add(block_id)
     
     def complete_follow_up_block(self, episode_id, block_id):
-        pass
+        self._episode_tracking[episode_id]['follow_up_blocks_completed'].add(block_id)
     
     def add_dialogue_turn(self, episode_id, question_id, question_text, 
                          patient_response, extracted_fields):
@@ -154,9 +160,6 @@ def test_parser_contract_integration():
     """Test that Dialogue Manager correctly handles new parser contract"""
     print("\n=== Testing Dialogue Manager V2 with Parser Contract ===\n")
     
-    # Import dialogue manager
-    from backend.core.dialogue_manager_v2 import DialogueManagerV2
-    
     # Create mocks
     state = MockStateManager()
     parser = MockParser()
@@ -9,13 +9,20 @@ Test categories:
 5. Configuration validation
 """
 
+import threading
+
 import pytest
+from backend.utils import episode_classifier
 from backend.utils.episode_classifier import (
     classify_field,
     is_episode_field,
     is_shared_field,
     is_collection_field,
+    get_episode_prefix_count,
+    get_shared_prefix_count,
+    get_collection_count,
     set_strict_mode,
+    strict_mode,
     EPISODE_PREFIXES,
     SHARED_PREFIXES,
     COLLECTION_FIELDS,
@@ -56,17 +63,21 @@ class TestPrefixRouting:
     
     def test_all_episode_prefixes_route_correctly(self):
         """Ensure all registered episode prefixes work"""
-        for prefix in EPISODE_PREFIXES:
-            test_field = f"{prefix}test_field"
-            assert classify_field(test_field) == 'episode', \
-                f"Prefix '{prefix}' failed to route as episode"
+        misrouted = {
+            prefix: classification
+            for prefix in EPISODE_PREFIXES
+            if (classification := classify_field(f"{prefix}test_field")) != 'episode'
+        }
+        assert not misrouted, f"Prefixes failed to route as episode: {misrouted}"
     
     def test_all_shared_prefixes_route_correctly(self):
         """Ensure all registered shared prefixes work"""
-        for prefix in SHARED_PREFIXES:
-            test_field = f"{prefix}test_field"
-            assert classify_field(test_field) == 'shared', \
-                f"Prefix '{prefix}' failed to route as shared"
+        misrouted = {
+            prefix: classification
+            for prefix in SHARED_PREFIXES
+            if (classification := classify_field(f"{prefix}test_field")) != 'shared'
+        }
+        assert not misrouted, f"Prefixes failed to route as shared: {misrouted}"
 
 
 class TestCollectionRouting:
@@ -101,14 +112,13 @@ class TestUnknownFields:
     """Test unknown field handling"""
     
     def test_unknown_field_returns_unknown_in_permissive_mode(self):
-        set_strict_mode(False)
-        assert classify_field('random_unknown_field') == 'unknown'
+        with strict_mode(False):
+            assert classify_field('random_unknown_field') == 'unknown'
     
     def test_unknown_field_raises_in_strict_mode(self):
-        set_strict_mode(True)
-        with pytest.raises(ValueError, match="Unknown field"):
-            classify_field('random_unknown_field')
-        set_strict_mode(False)  # Reset
+        with strict_mode():
+            with pytest.raises(ValueError, match="Unknown field"):
+                classify_field('random_unknown_field')
     
     def test_partial_prefix_match_is_unknown(self):
         # 'vl' without underscore should not match 'vl_'
@@ -151,6 +161,50 @@ class TestAmbiguityDetection:
             "Prefix overlap detected - should have been caught at import"
 
 
+class TestFieldRegistries:
+    """Test prefix and collection registry invariants"""
+    
+    def test_registries_are_frozensets(self):
+        assert isinstance(EPISODE_PREFIXES, frozenset)
+        assert isinstance(SHARED_PREFIXES, frozenset)
+        assert isinstance(COLLECTION_FIELDS, frozenset)
+    
+    @pytest.mark.parametrize('prefix', sorted(EPISODE_PREFIXES | SHARED_PREFIXES))
+    def test_prefix_is_single_segment(self, prefix):
+        assert prefix.endswith('_')
+        assert prefix.count('_') == 1
+    
+    def test_prefix_registries_are_disjoint(self):
+        assert EPISODE_PREFIXES.isdisjoint(SHARED_PREFIXES)
+    
+    @pytest.mark.parametrize('collection', sorted(COLLECTION_FIELDS))
+    def test_collection_matches_no_prefix(self, collection):
+        for prefix in EPISODE_PREFIXES | SHARED_PREFIXES:
+            assert not collection.startswith(prefix)
+    
+    def test_counts_match_registries(self):
+        assert get_episode_prefix_count() == len(EPISODE_PREFIXES)
+        assert get_shared_prefix_count() == len(SHARED_PREFIXES)
+        assert get_collection_count() == len(COLLECTION_FIELDS)
+    
+    @pytest.mark.parametrize('registry, message', [
+        ('EPISODE_PREFIXES', 'Malformed prefixes'),
+        ('SHARED_PREFIXES', 'Prefix registry overlap'),
+        ('COLLECTION_FIELDS', 'Collection field conflicts'),
+    ])
+    def test_validation_rejects_bad_registry(self, monkeypatch, registry, message):
+        bad_entry = {
+            'EPISODE_PREFIXES': 'vl_x_',  # Two segments
+            'SHARED_PREFIXES': 'vl_',  # Also an episode prefix
+            'COLLECTION_FIELDS': 'vl_history',  # Starts with an episode prefix
+        }[registry]
+        monkeypatch.setattr(
+            episode_classifier, registry, getattr(episode_classifier, registry) | {bad_entry}
+        )
+        with pytest.raises(RuntimeError, match=message):
+            episode_classifier._validate_prefix_sets()
+
+
 class TestHelperFunctions:
     """Test helper functions for backward compatibility"""
     
@@ -215,7 +269,45 @@ class TestStrictMode:
         assert classify_field('unknown') == 'unknown'
     
     def test_strict_mode_does_not_affect_valid_fields(self):
+        with strict_mode():
+            assert classify_field('vl_laterality') == 'episode'
+            assert classify_field('sh_smoking_status') == 'shared'
+    
+    def test_strict_mode_context_restores_previous_value(self):
+        set_strict_mode(False)
+        with strict_mode():
+            with strict_mode(False):
+                assert classify_field('unknown') == 'unknown'
+            with pytest.raises(ValueError):
+                classify_field('unknown')
+        assert classify_field('unknown') == 'unknown'
+    
+    def test_strict_mode_is_not_shared_across_threads(self):
+        seen = []
+        with strict_mode():
+            worker = threading.Thread(
+                target=lambda: seen.append(classify_field('unknown'))
+            )
+            worker.start()
+            worker.join()
+        assert seen == ['unknown']
+    
+    def test_set_strict_mode_is_process_wide(self):
+        errors = []
+        
+        def classify_in_thread():
+            try:
+                classify_field('unknown')
+            except ValueError as e:
+                errors.append(e)
+        
         set_strict_mode(True)
-        assert classify_field('vl_laterality') == 'episode'
-        assert classify_field('sh_smoking_status') == 'shared'
-        set_strict_mode(False)
\ No newline at end of file
+        try:
+            worker = threading.Thread(target=classify_in_thread)
+            worker.start()
+            worker.join()
+            with strict_mode(False):
+                assert classify_field('unknown') == 'unknown'
+        finally:
+            set_strict_mode(False)
+        assert len(errors) == 1
@@ -6,6 +6,8 @@ Tests the LLM-powered Episode Hypothesis Generator module.
 Run from project root:
     python -m tests.test_episode_hypothesis_generator
 
+Set EHG_TEST_LOG=DEBUG to see EHG/HF client debug logging.
+
 Requires:
     - HuggingFace model loaded (CUDA GPU recommended)
     - episode_hypothesis_generator.py
@@ -13,34 +15,55 @@ Requires:
     - hf_client_v2.py
 """
 
+import os
 import pytest
 import logging
 from unittest.mock import Mock, patch
 
-# Configure logging for tests
-logging.basicConfig(level=logging.DEBUG)
+# Configure logging for tests (quiet by default; EHG_TEST_LOG=DEBUG for detail)
+logging.basicConfig(level=os.environ.get("EHG_TEST_LOG", "WARNING").upper())
 
 # Import the module under test
 from backend.core.episode_hypothesis_generator import EpisodeHypothesisGenerator
 from backend.utils.episode_hypothesis_signal import EpisodeHypothesisSignal, ConfidenceBand
 
+# HF client methods EHG relies on (spec for mocks)
+HF_CLIENT_INTERFACE = ['is_loaded', 'generate_json']
+
+# Canned LLM outputs (str, as returned by generate_json)
+LLM_OUT_SINGLE = '{"hypothesis_count":1,"hypothesis_confidence":"high","pivot_detected":false,"pivot_confidence":"high"}'
+LLM_OUT_MULTIPLE = '{"hypothesis_count":2,"hypothesis_confidence":"medium","pivot_detected":false,"pivot_confidence":"low"}'
+LLM_OUT_PIVOT = '{"hypothesis_count":1,"hypothesis_confidence":"high","pivot_detected":true,"pivot_confidence":"medium"}'
+LLM_OUT_INVALID = 'not valid json'
+LLM_OUT_COUNT_ONLY = '{"hypothesis_count":2}'
+
+
+def _last_prompt(mock_hf_client):
+    """Prompt passed to the most recent generate_json call (keyword or positional)"""
+    call_args = mock_hf_client.generate_json.call_args
+    return call_args.kwargs.get('prompt') or call_args.args[0]
+
 
 class TestEpisodeHypothesisGeneratorUnit:
     """Unit tests with mocked HF client"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_hf_client(self):
-        """Create a mock HuggingFace client"""
-        mock = Mock()
-        mock.is_loaded.return_value = True
-        mock.generate_json = Mock()
-        return mock
+        """Create a mock HuggingFace client (shared, reset before each test)"""
+        return Mock(spec=HF_CLIENT_INTERFACE)
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def ehg(self, mock_hf_client):
-        """Create EHG with mock client"""
+        """Create EHG with mock client (once per module)"""
+        mock_hf_client.is_loaded.return_value = True
         return EpisodeHypothesisGenerator(mock_hf_client)
     
+    @pytest.fixture(autouse=True)
+    def _reset_mock_hf_client(self, mock_hf_client):
+        """Clear calls, return values and side effects left by the previous test"""
+        mock_hf_client.reset_mock(return_value=True, side_effect=True)
+        mock_hf_client.is_loaded.return_value = True
+    
     def test_init_validates_hf_client_interface(self):
         """Should reject objects without required methods"""
         # Object without generate_json method
@@ -71,90 +94,75 @@ class TestEpisodeHypothesisGeneratorUnit:
         assert signal.hypothesis_count == 0
         assert signal.pivot_detected == False
         assert signal.confidence_band == ConfidenceBand.HIGH
-        mock_hf_client.generate_json.assert_not_called()
+        assert mock_hf_client.generate_json.call_count == 0
     
     def test_none_utterance_returns_zero_hypothesis(self, ehg, mock_hf_client):
         """None input should return hypothesis_count=0 without calling LLM"""
         signal = ehg.generate_hypothesis(None)
         
         assert signal.hypothesis_count == 0
-        mock_hf_client.generate_json.assert_not_called()
-    
-    def test_valid_json_response_single_episode(self, ehg, mock_hf_client):
-        """Valid JSON with single episode should be parsed correctly"""
-        mock_hf_client.generate_json.return_value = '''
-        {"hypothesis_count": 1, "hypothesis_confidence": "high", "pivot_detected": false, "pivot_confidence": "high"}
-        '''
-        
-        signal = ehg.generate_hypothesis("My right eye hurts")
-        
-        assert signal.hypothesis_count == 1
-        assert signal.confidence_band == ConfidenceBand.HIGH
-        assert signal.pivot_detected == False
-        assert signal.pivot_confidence_band == ConfidenceBand.HIGH
-    
-    def test_valid_json_response_multiple_episodes(self, ehg, mock_hf_client):
-        """Valid JSON with multiple episodes should be parsed correctly"""
-        mock_hf_client.generate_json.return_value = '''
-        {"hypothesis_count": 2, "hypothesis_confidence": "medium", "pivot_detected": false, "pivot_confidence": "low"}
-        '''
-        
-        signal = ehg.generate_hypothesis("My right eye hurts and I also have headaches")
-        
-        assert signal.hypothesis_count == 2
-        assert signal.confidence_band == ConfidenceBand.MEDIUM
-        assert signal.pivot_detected == False
-        assert signal.pivot_confidence_band == ConfidenceBand.LOW
-    
-    def test_valid_json_response_pivot_detected(self, ehg, mock_hf_client):
-        """Valid JSON with pivot should be parsed correctly"""
-        mock_hf_client.generate_json.return_value = '''
-        {"hypothesis_count": 1, "hypothesis_confidence": "high", "pivot_detected": true, "pivot_confidence": "medium"}
-        '''
-        
-        signal = ehg.generate_hypothesis("Actually, forget about my eye, I want to talk about headaches")
-        
-        assert signal.hypothesis_count == 1
-        assert signal.pivot_detected == True
-        assert signal.pivot_confidence_band == ConfidenceBand.MEDIUM
-    
-    def test_invalid_json_returns_safe_default(self, ehg, mock_hf_client):
-        """Invalid JSON should return safe default signal"""
-        mock_hf_client.generate_json.return_value = "not valid json"
-        
-        signal = ehg.generate_hypothesis("My eye hurts")
-        
-        assert signal.hypothesis_count == 1
-        assert signal.pivot_detected == False
-        assert signal.confidence_band == ConfidenceBand.HIGH
-    
-    def test_missing_fields_use_defaults(self, ehg, mock_hf_client):
-        """Missing fields should use defaults"""
-        mock_hf_client.generate_json.return_value = '{"hypothesis_count": 2}'
-        
-        signal = ehg.generate_hypothesis("My eye hurts")
-        
-        assert signal.hypothesis_count == 2
-        # Missing fields should use defaults
-        assert signal.confidence_band == ConfidenceBand.HIGH
-        assert signal.pivot_detected == False
-        assert signal.pivot_confidence_band == ConfidenceBand.HIGH
-    
-    def test_negative_hypothesis_count_clamped_to_zero(self, ehg, mock_hf_client):
-        """Negative hypothesis count should be clamped to 0"""
-        mock_hf_client.generate_json.return_value = '{"hypothesis_count": -1}'
-        
-        signal = ehg.generate_hypothesis("My eye hurts")
-        
-        assert signal.hypothesis_count == 0
-    
-    def test_high_hypothesis_count_capped_at_two(self, ehg, mock_hf_client):
-        """High hypothesis count should be capped at 2"""
-        mock_hf_client.generate_json.return_value = '{"hypothesis_count": 5}'
-        
-        signal = ehg.generate_hypothesis("My eye hurts")
-        
-        assert signal.hypothesis_count == 2
+        assert mock_hf_client.generate_json.call_count == 0
+    
+    # (llm_output, utterance, expected (count, confidence, pivot, pivot_confidence))
+    PARSE_CASES = {
+        'single_episode': (
+            LLM_OUT_SINGLE,
+            "My right eye hurts",
+            (1, ConfidenceBand.HIGH, False, ConfidenceBand.HIGH)
+        ),
+        'multiple_episodes': (
+            LLM_OUT_MULTIPLE,
+            "My right eye hurts and I also have headaches",
+            (2, ConfidenceBand.MEDIUM, False, ConfidenceBand.LOW)
+        ),
+        'pivot_detected': (
+            LLM_OUT_PIVOT,
+            "Actually, forget about my eye, I want to talk about headaches",
+            (1, ConfidenceBand.HIGH, True, ConfidenceBand.MEDIUM)
+        ),
+        # Invalid JSON returns the safe default signal
+        'invalid_json': (
+            LLM_OUT_INVALID,
+            "My eye hurts",
+            (1, ConfidenceBand.HIGH, False, ConfidenceBand.HIGH)
+        ),
+        # Missing fields use defaults
+        'missing_fields': (
+            LLM_OUT_COUNT_ONLY,
+            "My eye hurts",
+            (2, ConfidenceBand.HIGH, False, ConfidenceBand.HIGH)
+        ),
+    }
+    
+    @pytest.mark.parametrize(
+        "llm_output, utterance, expected",
+        list(PARSE_CASES.values()),
+        ids=list(PARSE_CASES)
+    )
+    def test_parse_llm_output(self, ehg, mock_hf_client, llm_output, utterance, expected):
+        """LLM output should be parsed, coerced and defaulted into a signal"""
+        mock_hf_client.generate_json.return_value = llm_output
+        
+        signal = ehg.generate_hypothesis(utterance)
+        
+        assert (
+            signal.hypothesis_count,
+            signal.confidence_band,
+            signal.pivot_detected,
+            signal.pivot_confidence_band
+        ) == expected
+    
+    @pytest.mark.parametrize("parsed, expected_count", [
+        ({"hypothesis_count": -1}, 0),
+        ({"hypothesis_count": 5}, 2),
+        ({"hypothesis_count": "2"}, 2),
+        ({"hypothesis_count": "many"}, 1),
+    ], ids=["negative_clamped_to_zero", "high_capped_at_two", "numeric_string", "non_numeric"])
+    def test_hypothesis_count_coercion(self, ehg, parsed, expected_count):
+        """hypothesis_count should be coerced to 0, 1 or 2 (no JSON decoding involved)"""
+        signal = ehg._signal_from_parsed(parsed)
+        
+        assert signal.hypothesis_count == expected_count
     
     def test_llm_call_failure_raises_runtime_error(self, ehg, mock_hf_client):
         """LLM call failure should raise RuntimeError"""
@@ -163,35 +171,23 @@ class TestEpisodeHypothesisGeneratorUnit:
         with pytest.raises(RuntimeError, match="EHG LLM call failed"):
             ehg.generate_hypothesis("My eye hurts")
     
-    def test_prompt_includes_system_question(self, ehg, mock_hf_client):
-        """Prompt should include last system question when provided"""
-        mock_hf_client.generate_json.return_value = '{"hypothesis_count": 1}'
-        
-        ehg.generate_hypothesis(
-            "Both eyes",
-            last_system_question="Which eye is affected?"
-        )
-        
-        # Check the prompt was built with the question
-        call_args = mock_hf_client.generate_json.call_args
-        prompt = call_args.kwargs.get('prompt') or call_args.args[0]
-        assert "Which eye is affected?" in prompt
-    
-    def test_prompt_includes_episode_context(self, ehg, mock_hf_client):
-        """Prompt should include episode context when provided"""
-        mock_hf_client.generate_json.return_value = '{"hypothesis_count": 1}'
-        
-        context = {"active_symptom_categories": ["visual_loss", "headache"]}
-        ehg.generate_hypothesis(
-            "It's getting worse",
-            current_episode_context=context
-        )
-        
-        # Check the prompt includes context
-        call_args = mock_hf_client.generate_json.call_args
-        prompt = call_args.kwargs.get('prompt') or call_args.args[0]
-        assert "visual_loss" in prompt
-        assert "headache" in prompt
+    @pytest.mark.parametrize("utterance, kwargs, expected_in_prompt", [
+        ("Both eyes",
+         {"last_system_question": "Which eye is affected?"},
+         ["Which eye is affected?"]),
+        ("It's getting worse",
+         {"current_episode_context": {"active_symptom_categories": ["visual_loss", "headache"]}},
+         ["visual_loss", "headache"]),
+    ], ids=["system_question", "episode_context"])
+    def test_prompt_includes_context(self, ehg, mock_hf_client, utterance, kwargs, expected_in_prompt):
+        """Prompt should include the system question / episode context when provided"""
+        mock_hf_client.generate_json.return_value = LLM_OUT_SINGLE
+        
+        ehg.generate_hypothesis(utterance, **kwargs)
+        
+        prompt = _last_prompt(mock_hf_client)
+        for expected in expected_in_prompt:
+            assert expected in prompt
 
 
 class TestEpisodeHypothesisGeneratorIntegration:
@@ -200,26 +196,13 @@ class TestEpisodeHypothesisGeneratorIntegration:
     
     These tests require a GPU and will be slow.
     Mark with @pytest.mark.slow for optional skipping.
+    Skipped without torch or CUDA by the hf_client_mistral_4bit fixture.
     """
     
-    @pytest.fixture(scope="class")
-    def real_hf_client(self):
-        """Load real HuggingFace client (expensive - once per class)"""
-        from backend.utils.hf_client_v2 import HuggingFaceClient
-        
-        try:
-            client = HuggingFaceClient(
-                model_name="mistralai/Mistral-7B-Instruct-v0.2",
-                load_in_4bit=True
-            )
-            return client
-        except Exception as e:
-            pytest.skip(f"Could not load HF client: {e}")
-    
     @pytest.fixture
-    def ehg(self, real_hf_client):
-        """Create EHG with real client"""
-        return EpisodeHypothesisGenerator(real_hf_client)
+    def ehg(self, hf_client_mistral_4bit):
+        """Create EHG with real client (session-scoped, see conftest.py)"""
+        return EpisodeHypothesisGenerator(hf_client_mistral_4bit)
     
     @pytest.mark.slow
     def test_single_episode_response(self, ehg):
@@ -301,6 +301,10 @@ def test_export_for_summary():
     assert len(exported['dialogue_history'][ep1]) == 1
     assert exported['dialogue_history'][ep1][0]['question_id'] == 'vl_1'
     
+    # Exported turns are copies
+    exported['dialogue_history'][ep1][0]['extracted']['vl_laterality'] = 'bilateral'
+    assert state.get_dialogue_history(ep1)[0]['extracted']['vl_laterality'] == 'monocular_right'
+    
     print("✓ Export for summary test passed")
 
 
@@ -331,6 +335,33 @@ def test_reset():
     print("✓ Reset test passed")
 
 
+def test_turn_timestamp_scoped_to_explicit_turn():
+    """Test writes share a timestamp only between begin_turn() and end_turn()"""
+    state = StateManagerV2()
+    ep1 = state.create_episode()
+    assert state._turn_timestamp is None  # Not cached outside a turn
+    
+    state.begin_turn()
+    state.set_episode_field(ep1, 'vl_laterality', 'right')
+    turn_time = state._turn_timestamp
+    assert turn_time is not None
+    state.add_dialogue_turn(ep1, 'vl_1', 'Which eye?', 'Right', {})
+    assert state.get_dialogue_history(ep1)[0]['timestamp'] == turn_time
+    
+    state.end_turn()
+    assert state._turn_timestamp is None
+    
+    # reset() also ends the turn
+    state.begin_turn()
+    state.create_episode()
+    state.reset()
+    assert state._turn_timestamp is None
+    state.create_episode()
+    assert state._turn_timestamp is None
+    
+    print("✓ Turn timestamp scope test passed")
+
+
 def test_summary_stats():
     """Test summary statistics"""
     state = StateManagerV2()
@@ -378,6 +409,267 @@ def test_field_overwrite():
     print("✓ Field overwrite test passed")
 
 
+def test_tracking_sets_are_cached_frozensets():
+    """Test tracking set getters return cached immutable views"""
+    state = StateManagerV2()
+    ep1 = state.create_episode()
+    
+    state.mark_question_answered(ep1, 'vl_1')
+    answered = state.get_questions_answered(ep1)
+    assert answered == frozenset({'vl_1'})
+    assert isinstance(answered, frozenset)
+    
+    # Unchanged set returns the same cached object
+    assert state.get_questions_answered(ep1) is answered
+    
+    # Write invalidates the cache
+    state.mark_question_answered(ep1, 'vl_2')
+    assert state.get_questions_answered(ep1) == frozenset({'vl_1', 'vl_2'})
+    assert answered == frozenset({'vl_1'})
+    
+    # Selector view exposes the same frozensets
+    state.activate_follow_up_block(ep1, 'block_1')
+    selector_view = state.get_episode_for_selector(ep1)
+    assert selector_view['questions_answered'] is state.get_questions_answered(ep1)
+    assert selector_view['follow_up_blocks_activated'] == frozenset({'block_1'})
+    
+    # Provenance is a read-only view
+    state.set_episode_field(ep1, 'vl_laterality', 'right')
+    selector_view = state.get_episode_for_selector(ep1)
+    assert 'vl_laterality' in selector_view['_provenance']
+    try:
+        selector_view['_provenance']['vl_laterality'] = {}
+        assert False, "Selector provenance should be read-only"
+    except TypeError:
+        pass
+    try:
+        selector_view['_provenance']['vl_laterality']['confidence'] = 'high'
+        assert False, "Selector provenance records should be read-only"
+    except TypeError:
+        pass
+    
+    # View is detached from later writes
+    state.set_episode_field(ep1, 'vl_onset_speed', 'acute')
+    assert 'vl_onset_speed' not in selector_view['_provenance']
+    
+    print("✓ Tracking set frozenset cache test passed")
+
+
+def test_snapshot_reuses_serialized_provenance():
+    """Test unchanged provenance records are not re-serialized between snapshots"""
+    state = StateManagerV2()
+    ep1 = state.create_episode()
+    state.set_episode_field(ep1, 'vl_laterality', 'right')
+    state.set_episode_field(ep1, 'vl_onset_speed', 'acute')
+    
+    first = state.snapshot_state()['episodes'][0]['_provenance']
+    memo = state._serialized_provenance[(ep1, 'vl_laterality')]
+    
+    state.set_episode_field(ep1, 'vl_onset_speed', 'gradual', provenance={
+        'source': 'response_parser',
+        'confidence': 'high',
+        'mode': state.conversation_mode
+    })
+    second = state.snapshot_state()['episodes'][0]['_provenance']
+    
+    # Unchanged field reuses the memoized record, rewritten field does not
+    assert state._serialized_provenance[(ep1, 'vl_laterality')] is memo
+    assert second['vl_laterality'] == first['vl_laterality']
+    assert second['vl_onset_speed']['source'] == 'response_parser'
+    assert first['vl_onset_speed']['source'] == 'default'
+    
+    # Snapshots do not share records with each other or with the memo
+    assert second['vl_laterality'] is not first['vl_laterality']
+    first['vl_laterality']['confidence'] = 'high'
+    assert state.snapshot_state()['episodes'][0]['_provenance']['vl_laterality']['confidence'] == 'low'
+    
+    print("✓ Serialized provenance cache test passed")
+
+
+def test_snapshot_round_trip():
+    """Test from_snapshot restores provenance, empty episodes and tracking sets"""
+    import json
+    from backend.utils.conversation_modes import ConversationMode
+    
+    state = StateManagerV2()
+    ep1 = state.create_episode()
+    state.create_episode()  # Empty episode (no provenance)
+    state.set_episode_field(ep1, 'vl_laterality', 'right')
+    state.mark_question_answered(ep1, 'vl_1')
+    state.set_shared_field('medications', [{'name': 'aspirin'}])
+    
+    snapshot = json.loads(json.dumps(state.snapshot_state()))
+    restored = StateManagerV2.from_snapshot(snapshot)
+    
+    assert restored.get_episode_count() == 2
+    assert restored.get_questions_answered(ep1) == frozenset({'vl_1'})
+    assert restored.get_questions_satisfied(ep1) == frozenset()
+    assert restored.get_episode(ep1)['_provenance']['vl_laterality']['mode'] is ConversationMode.MODE_DISCOVERY
+    assert restored.get_episode(2)['_provenance'] == {}
+    assert restored.get_shared_data()['_provenance']['medications']['source'] == 'default'
+    
+    # Lossless: re-snapshot matches original
+    assert json.loads(json.dumps(restored.snapshot_state())) == snapshot
+    
+    print("✓ Snapshot round trip test passed")
+
+
+def test_snapshot_persistence_round_trip():
+    """Test a populated snapshot saves through ConsultationPersistence and loads back"""
+    import tempfile
+    from backend.commands import ConsultationState
+    from backend.persistence import ConsultationPersistence
+    
+    state = StateManagerV2()
+    ep1 = state.create_episode()
+    state.set_episode_field(ep1, 'vl_laterality', 'right')
+    state.add_dialogue_turn(ep1, 'vl_1', 'Which eye?', 'My right eye', {'vl_laterality': 'right'})
+    snapshot = state.snapshot_state()
+    snapshot['turn_count'] = 1
+    
+    with tempfile.TemporaryDirectory() as base_dir:
+        persistence = ConsultationPersistence(base_dir=base_dir)
+        persistence.save_turn('abc123', ConsultationState.from_json(snapshot))
+        loaded = persistence.load_latest_turn('abc123')
+    
+    assert loaded.turn_count == 1
+    restored = StateManagerV2.from_snapshot(loaded.to_json())
+    assert restored.get_episode_field(ep1, 'vl_laterality') == 'right'
+    assert restored.get_dialogue_history(ep1)[0]['response'] == 'My right eye'
+    
+    print("✓ Snapshot persistence round trip test passed")
+
+
+def test_data_model_reloaded_after_edit():
+    """Test an edited data model file is re-read instead of served from cache"""
+    import json
+    import os
+    import tempfile
+    
+    with open('data/clinical_data_model.json') as f:
+        data_model = json.load(f)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'clinical_data_model.json')
+        with open(path, 'w') as f:
+            json.dump(data_model, f)
+        assert 'test_marker' not in StateManagerV2(path).get_shared_data()
+        
+        data_model['shared_data_template']['test_marker'] = 'edited'
+        with open(path, 'w') as f:
+            json.dump(data_model, f)
+        mtime_ns = os.stat(path).st_mtime_ns + 1_000_000_000
+        os.utime(path, ns=(mtime_ns, mtime_ns))  # Coarse filesystem clocks
+        assert StateManagerV2(path).get_shared_data()['test_marker'] == 'edited'
+    
+    print("✓ Data model reload test passed")
+
+
+def test_rehydrated_provenance_is_isolated():
+    """Test shared deserialized provenance records cannot leak edits across instances"""
+    state = StateManagerV2()
+    ep1 = state.create_episode()
+    state.set_episode_field(ep1, 'vl_laterality', 'right')
+    snapshot = state.snapshot_state()
+    
+    first = StateManagerV2.from_snapshot(snapshot)
+    second = StateManagerV2.from_snapshot(snapshot)
+    
+    # Copies handed out by get_episode are caller-owned
+    episode = first.get_episode(ep1)
+    episode['_provenance']['vl_laterality']['confidence'] = 'high'
+    assert first.get_episode(ep1)['_provenance']['vl_laterality']['confidence'] == 'low'
+    assert second.get_episode(ep1)['_provenance']['vl_laterality']['confidence'] == 'low'
+    
+    # Stored records are read-only
+    try:
+        first._provenance[ep1]['vl_laterality']['confidence'] = 'high'
+        assert False, "Stored provenance records should be read-only"
+    except TypeError:
+        pass
+    
+    print("✓ Rehydrated provenance isolation test passed")
+
+
+def test_stored_provenance_is_read_only():
+    """Test default and caller-supplied provenance cannot be edited after storing"""
+    from backend.utils.conversation_modes import ConversationMode
+    
+    state = StateManagerV2()
+    ep1 = state.create_episode()
+    state.set_episode_field(ep1, 'vl_laterality', 'right')  # Shared default record
+    caller_prov = {
+        'source': 'response_parser',
+        'confidence': 'high',
+        'mode': ConversationMode.MODE_DISCOVERY
+    }
+    state.set_episode_field(ep1, 'vl_onset_speed', 'acute', provenance=caller_prov)
+    caller_prov['confidence'] = 'low'  # Caller keeps ownership of its dict
+    
+    for field_name in ('vl_laterality', 'vl_onset_speed'):
+        try:
+            state._provenance[ep1][field_name]['confidence'] = 'high'
+            assert False, "Stored provenance records should be read-only"
+        except TypeError:
+            pass
+    
+    # A new consultation still sees untouched defaults
+    other = StateManagerV2()
+    other_ep = other.create_episode()
+    other.set_episode_field(other_ep, 'vl_laterality', 'left')
+    assert other.get_episode(other_ep)['_provenance']['vl_laterality']['confidence'] == 'low'
+    assert state.get_episode(ep1)['_provenance']['vl_onset_speed']['confidence'] == 'high'
+    
+    print("✓ Stored provenance read-only test passed")
+
+
+def test_collection_weakest_link_confidence():
+    """Test collection confidence degrades on update and never improves"""
+    from backend.utils.conversation_modes import ConversationMode
+    
+    def prov(confidence):
+        return {
+            'source': 'response_parser',
+            'confidence': confidence,
+            'mode': ConversationMode.MODE_EPISODE_EXTRACTION
+        }
+    
+    state = StateManagerV2()
+    state.set_shared_field('medications', [{'name': 'aspirin'}], provenance=prov('medium'))
+    
+    state.set_shared_field('medications', [{'name': 'aspirin'}], provenance=prov('high'))
+    assert state.get_shared_data()['_provenance']['medications']['confidence'] == 'medium'
+    
+    state.set_shared_field('medications', [], provenance=prov('low'))
+    assert state.get_shared_data()['_provenance']['medications']['confidence'] == 'low'
+    
+    # Non-collection shared fields are last-writer-wins
+    state.set_shared_field('sh_smoking_status', 'never', provenance=prov('low'))
+    state.set_shared_field('sh_smoking_status', 'never', provenance=prov('high'))
+    assert state.get_shared_data()['_provenance']['sh_smoking_status']['confidence'] == 'high'
+    
+    print("✓ Weakest-link confidence test passed")
+
+
+def test_clinical_view_skips_empty_episodes():
+    """Test export_clinical_view drops metadata-only episodes, also after rehydration"""
+    state = StateManagerV2()
+    ep1 = state.create_episode()
+    ep2 = state.create_episode()
+    state.mark_question_answered(ep1, 'vl_1')  # Operational only, still empty
+    state.set_episode_field(ep2, 'h_present', False)  # Falsy value is still clinical data
+    
+    exported = state.export_clinical_view()
+    assert [ep['episode_id'] for ep in exported['episodes']] == [ep2]
+    
+    restored = StateManagerV2.from_snapshot(state.snapshot_state())
+    exported = restored.export_clinical_view()
+    assert [ep['episode_id'] for ep in exported['episodes']] == [ep2]
+    assert exported['episodes'][0]['h_present'] is False
+    
+    print("✓ Clinical view empty episode filter test passed")
+
+
 if __name__ == '__main__':
     print("\n" + "="*60)
     print("TESTING STATE MANAGER V2")
@@ -392,8 +684,18 @@ if __name__ == '__main__':
     test_export_for_json()
     test_export_for_summary()
     test_reset()
+    test_turn_timestamp_scoped_to_explicit_turn()
     test_summary_stats()
     test_field_overwrite()
+    test_tracking_sets_are_cached_frozensets()
+    test_snapshot_reuses_serialized_provenance()
+    test_snapshot_round_trip()
+    test_snapshot_persistence_round_trip()
+    test_data_model_reloaded_after_edit()
+    test_rehydrated_provenance_is_isolated()
+    test_stored_provenance_is_read_only()
+    test_collection_weakest_link_confidence()
+    test_clinical_view_skips_empty_episodes()
     
     print("\n" + "="*60)
     print("ALL STATE MANAGER V2 TESTS PASSED ✓")